@@ -30,7 +30,7 @@ from upstream.constants import (
 from upstream.metrics import (
     track_alert_created,
     track_alert_delivered,
-    alert_failed,
+    track_alert_failed,
     alert_suppressed,
     alert_processing_time,
 )
@@ -264,7 +264,6 @@ def send_alert_notification(alert_event):
         alert_suppressed.labels(
             product=product_name,
             reason=suppression_reason,
-            customer_id=str(alert_event.customer.id),
         ).inc()
 
         logger.info(f"Alert event {alert_event.id} suppressed: {suppression_reason}")
@@ -337,12 +336,12 @@ def send_alert_notification(alert_event):
             alert_event.save()
 
             # Track alert failure metric
-            alert_failed.labels(
-                product=product_name,
-                channel_type="unknown",
-                error_type=e.__class__.__name__,
-                customer_id=str(alert_event.customer.id),
-            ).inc()
+            track_alert_failed(
+                product_name,
+                "unknown",
+                e.__class__.__name__,
+                alert_event.customer_id,
+            )
 
             # Create audit event for failed send
             create_audit_event(
@@ -30,3 +30,7 @@ class UpstreamConfig(AppConfig):
         # Register monitoring checks (Phase 3 - Task #5)
         # Import monitoring_checks to register Django system checks
         import upstream.monitoring_checks  # noqa: F401
+
+        # Keep Celery worker status warm off the probe path (no-op when
+        # Celery is disabled)
+        upstream.monitoring_checks.start_celery_status_refresher()
@@ -20,8 +20,8 @@ from django.core.cache import cache
 from upstream.metrics import (
     background_job_started,
     background_job_completed,
-    background_job_failed,
     background_job_duration,
+    track_background_job_failed,
 )
 
 logger = logging.getLogger(__name__)
@@ -72,9 +72,7 @@ def monitor_task(task_func: Callable) -> Callable:
             customer_id = str(args[0])
 
         # Track task start
-        background_job_started.labels(
-            task_name=task_name, customer_id=customer_id
-        ).inc()
+        background_job_started.labels(task_name=task_name).inc()
 
         start_time = time.time()
         error = None
@@ -85,9 +83,7 @@ def monitor_task(task_func: Callable) -> Callable:
 
             # Track success
             duration = time.time() - start_time
-            background_job_completed.labels(
-                task_name=task_name, customer_id=customer_id
-            ).inc()
+            background_job_completed.labels(task_name=task_name).inc()
             background_job_duration.labels(task_name=task_name).observe(duration)
 
             logger.info(
@@ -102,9 +98,7 @@ def monitor_task(task_func: Callable) -> Callable:
             duration = time.time() - start_time
             error_type = e.__class__.__name__
 
-            background_job_failed.labels(
-                task_name=task_name, error_type=error_type, customer_id=customer_id
-            ).inc()
+            track_background_job_failed(task_name, error_type)
             background_job_duration.labels(task_name=task_name).observe(duration)
 
             logger.error(
@@ -147,9 +141,7 @@ class MonitoredTask(Task):
             customer_id = str(args[0])
 
         # Track task start
-        background_job_started.labels(
-            task_name=task_name, customer_id=customer_id
-        ).inc()
+        background_job_started.labels(task_name=task_name).inc()
 
         start_time = time.time()
 
@@ -159,9 +151,7 @@ class MonitoredTask(Task):
 
             # Track success
             duration = time.time() - start_time
-            background_job_completed.labels(
-                task_name=task_name, customer_id=customer_id
-            ).inc()
+            background_job_completed.labels(task_name=task_name).inc()
             background_job_duration.labels(task_name=task_name).observe(duration)
 
             logger.info(
@@ -176,9 +166,7 @@ class MonitoredTask(Task):
             duration = time.time() - start_time
             error_type = e.__class__.__name__
 
-            background_job_failed.labels(
-                task_name=task_name, error_type=error_type, customer_id=customer_id
-            ).inc()
+            track_background_job_failed(task_name, error_type)
             background_job_duration.labels(task_name=task_name).observe(duration)
 
             logger.error(
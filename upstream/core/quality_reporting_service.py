@@ -316,7 +316,7 @@ class DataQualityReportingService:
 
         High-level summary of data quality health.
         """
-        from upstream.models import Upload, DataQualityReport
+        from upstream.models import Upload, DataQualityDailySummary
         from upstream.core.validation_models import DataQualityMetric, DataAnomalyDetection
 
         # Last 30 days
@@ -329,17 +329,16 @@ class DataQualityReportingService:
             status__in=['success', 'partial']
         )
 
-        # Calculate average quality score
-        quality_reports = DataQualityReport.objects.filter(
+        # Calculate average quality score from the daily rollup table:
+        # one row per customer-day instead of one per quality report
+        rollup = DataQualityDailySummary.objects.filter(
             customer=self.customer,
-            created_at__gte=thirty_days_ago
-        )
+            day__gte=thirty_days_ago.date()
+        ).aggregate(accepted=Sum('accepted_rows'), total=Sum('total_rows'))
 
-        avg_quality_score = 0
-        if quality_reports.exists():
-            total_accepted = quality_reports.aggregate(Sum('accepted_rows'))['accepted_rows__sum'] or 0
-            total_rows = quality_reports.aggregate(Sum('total_rows'))['total_rows__sum'] or 0
-            avg_quality_score = (total_accepted / total_rows) if total_rows > 0 else 0
+        total_rows = rollup['total'] or 0
+        total_accepted = rollup['accepted'] or 0
+        avg_quality_score = (total_accepted / total_rows) if total_rows > 0 else 0
 
         # Latest quality metrics
         latest_metrics = {}
@@ -378,7 +377,7 @@ class DataQualityReportingService:
             'average_quality_score': avg_quality_score,
             'average_acceptance_rate': avg_quality_score * 100,
             'uploads_count': recent_uploads.count(),
-            'total_rows_processed': quality_reports.aggregate(Sum('total_rows'))['total_rows__sum'] or 0,
+            'total_rows_processed': total_rows,
             'quality_metrics': latest_metrics,
             'open_issues': {
                 'total_anomalies': open_anomalies.count(),
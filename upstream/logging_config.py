@@ -20,28 +20,54 @@ Retention Policies (HIPAA-aligned):
 Related: TECH-DEBT Phase 3 - DevOps Monitoring & Metrics
 """
 
+import functools
 from pathlib import Path
 from typing import Dict, Any
 
 
+@functools.lru_cache(maxsize=None)
+def get_logs_dir() -> Path:
+    """
+    Return the log directory (BASE_DIR/logs), computed once per process.
+
+    Management commands and config helpers all derive this same path;
+    caching avoids rebuilding Path objects on every call.
+    """
+    from django.conf import settings
+
+    return Path(settings.BASE_DIR) / "logs"
+
+
+# Retention periods in days per log level, resolved once at import time
+DEBUG_RETENTION = 7  # Short retention for verbose dev logs
+INFO_RETENTION = 30  # Standard retention for operational logs
+WARNING_RETENTION = 90  # Extended retention for potential issues
+ERROR_RETENTION = 90  # Extended retention for troubleshooting
+CRITICAL_RETENTION = 90  # Extended retention for critical incidents
+
+_RETENTION_MAP = {
+    "DEBUG": DEBUG_RETENTION,
+    "INFO": INFO_RETENTION,
+    "WARNING": WARNING_RETENTION,
+    "ERROR": ERROR_RETENTION,
+    "CRITICAL": CRITICAL_RETENTION,
+}
+
+
 def get_log_retention_days(log_level: str) -> int:
     """
     Get retention period in days for a log level.
 
+    Thin wrapper over the module-level constants for external callers;
+    internal code uses the constants directly.
+
     Args:
         log_level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 
     Returns:
         int: Number of days to retain logs
     """
-    retention_map = {
-        "DEBUG": 7,  # Short retention for verbose dev logs
-        "INFO": 30,  # Standard retention for operational logs
-        "WARNING": 90,  # Extended retention for potential issues
-        "ERROR": 90,  # Extended retention for troubleshooting
-        "CRITICAL": 90,  # Extended retention for critical incidents
-    }
-    return retention_map.get(log_level.upper(), 30)
+    return _RETENTION_MAP.get(log_level.upper(), INFO_RETENTION)
 
 
 def get_logging_config(
@@ -52,6 +78,10 @@ def get_logging_config(
     """
     Generate logging configuration dict for Django LOGGING setting.
 
+    The config is built once per (base_dir, environment, log_level) and
+    cached; callers receive a deep copy so downstream mutation cannot
+    poison the cache.
+
     Args:
         base_dir: Django BASE_DIR path
         environment: Environment name ('production', 'development', 'test')
@@ -60,14 +90,36 @@ def get_logging_config(
     Returns:
         Dict: Django LOGGING configuration
     """
+    import copy
+
     # Create logs directory structure
-    log_dir = base_dir / "logs"
+    log_dir = Path(base_dir) / "logs"
     log_dir.mkdir(exist_ok=True)
 
     # Archive directory for rotated logs
     archive_dir = log_dir / "archive"
     archive_dir.mkdir(exist_ok=True)
 
+    return copy.deepcopy(
+        _build_logging_config(str(base_dir), environment, log_level)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_logging_config(
+    base_dir: str,
+    environment: str,
+    log_level: str,
+) -> Dict[str, Any]:
+    """
+    Build the LOGGING dict for get_logging_config (memoized per arguments).
+
+    Worker bootstrap and test suites call get_logging_config repeatedly;
+    constructing the ~50-entry handler/logger dict once per process per
+    argument set avoids hundreds of dict/list allocations per call.
+    """
+    log_dir = Path(base_dir) / "logs"
+
     # Determine PHI scrubber based on environment
     if environment == "production":
         phi_scrubber = "upstream.logging_filters.AggressivePHIScrubberFilter"
@@ -139,11 +191,11 @@ def get_logging_config(
         # General application logs (INFO and above)
         # Rotates daily at midnight, keeps 30 days
         "app_file": {
-            "class": "logging.handlers.TimedRotatingFileHandler",
+            "class": "upstream.logging_utils.QueuedTimedRotatingFileHandler",
             "filename": str(log_dir / "app.log"),
             "when": "midnight",
             "interval": 1,
-            "backupCount": get_log_retention_days("INFO"),
+            "backupCount": INFO_RETENTION,
             "formatter": formatter_name,
             "filters": ["phi_scrubber"],
             "level": "INFO",
@@ -152,11 +204,11 @@ def get_logging_config(
         # Error logs (WARNING and above)
         # Rotates daily, keeps 90 days
         "error_file": {
-            "class": "logging.handlers.TimedRotatingFileHandler",
+            "class": "upstream.logging_utils.QueuedTimedRotatingFileHandler",
             "filename": str(log_dir / "error.log"),
             "when": "midnight",
             "interval": 1,
-            "backupCount": get_log_retention_days("ERROR"),
+            "backupCount": ERROR_RETENTION,
             "formatter": formatter_name,
             "filters": ["phi_scrubber"],
             "level": "WARNING",
@@ -166,7 +218,7 @@ def get_logging_config(
         # Rotates daily, keeps 2555 days (7 years)
         # Note: In production, use log aggregation service for long-term storage
         "audit_file": {
-            "class": "logging.handlers.TimedRotatingFileHandler",
+            "class": "upstream.logging_utils.QueuedTimedRotatingFileHandler",
             "filename": str(log_dir / "audit.log"),
             "when": "midnight",
             "interval": 1,
@@ -179,11 +231,11 @@ def get_logging_config(
         # Security logs (authentication, authorization, access control)
         # Rotates daily, keeps 90 days
         "security_file": {
-            "class": "logging.handlers.TimedRotatingFileHandler",
+            "class": "upstream.logging_utils.QueuedTimedRotatingFileHandler",
             "filename": str(log_dir / "security.log"),
             "when": "midnight",
             "interval": 1,
-            "backupCount": get_log_retention_days("WARNING"),
+            "backupCount": WARNING_RETENTION,
             "formatter": formatter_name,
             "filters": ["phi_scrubber"],
             "level": "INFO",
@@ -192,11 +244,11 @@ def get_logging_config(
         # Performance logs (slow queries, high latency, etc.)
         # Rotates daily, keeps 30 days
         "performance_file": {
-            "class": "logging.handlers.TimedRotatingFileHandler",
+            "class": "upstream.logging_utils.QueuedTimedRotatingFileHandler",
             "filename": str(log_dir / "performance.log"),
             "when": "midnight",
             "interval": 1,
-            "backupCount": get_log_retention_days("INFO"),
+            "backupCount": INFO_RETENTION,
             "formatter": formatter_name,
             "filters": ["phi_scrubber"],
             "level": "INFO",
@@ -315,7 +367,7 @@ def get_logging_config(
             "class": "logging.handlers.RotatingFileHandler",
             "filename": str(log_dir / "debug.log"),
             "maxBytes": 10 * 1024 * 1024,  # 10 MB
-            "backupCount": get_log_retention_days("DEBUG"),
+            "backupCount": DEBUG_RETENTION,
             "formatter": "verbose",
             "filters": ["phi_scrubber"],
             "level": "DEBUG",
@@ -324,6 +376,23 @@ def get_logging_config(
         # Add debug handler to upstream logger
         config["loggers"]["upstream"]["handlers"].append("debug_file")
 
+    # Production-specific: optionally drop the console handler. Under
+    # gunicorn, stdout goes to systemd/journald through a pipe, so every
+    # record costs an extra syscall duplicating what the file handlers
+    # already persist.
+    if environment == "production":
+        from decouple import config as env_config
+
+        if env_config("NO_CONSOLE_LOG", default=False, cast=bool):
+            del config["handlers"]["console"]
+            for logger_config in config["loggers"].values():
+                logger_config["handlers"] = [
+                    h for h in logger_config["handlers"] if h != "console"
+                ]
+            config["root"]["handlers"] = [
+                h for h in config["root"]["handlers"] if h != "console"
+            ]
+
     return config
 
 
@@ -341,6 +410,7 @@ def cleanup_old_logs(log_dir: Path, dry_run: bool = False) -> Dict[str, Any]:
     Returns:
         Dict with cleanup statistics
     """
+    import os
     import time
 
     stats = {
@@ -353,36 +423,40 @@ def cleanup_old_logs(log_dir: Path, dry_run: bool = False) -> Dict[str, Any]:
     # Current time
     now = time.time()
 
-    # Patterns for log files and their retention policies
-    log_patterns = {
-        "debug.log": get_log_retention_days("DEBUG"),
-        "app.log": get_log_retention_days("INFO"),
-        "error.log": get_log_retention_days("ERROR"),
-        "security.log": get_log_retention_days("WARNING"),
-        "performance.log": get_log_retention_days("INFO"),
-        # Audit logs are kept for 7 years (handled by TimedRotatingFileHandler)
+    # Retention policy per rotated-file base name, computed once before the
+    # loop (e.g., "app" covers app.log.2024-01-15)
+    retention_by_base = {
+        "debug": DEBUG_RETENTION,
+        "app": INFO_RETENTION,
+        "error": ERROR_RETENTION,
+        "security": WARNING_RETENTION,
+        "performance": INFO_RETENTION,
+        # Audit logs are kept for 7 years (handled by the rotating handler)
     }
 
-    for log_pattern, retention_days in log_patterns.items():
-        # Find rotated log files (e.g., app.log.2024-01-15)
-        pattern_base = log_pattern.replace(".log", "")
-        for log_file in log_dir.glob(f"{pattern_base}.log.*"):
+    # Single os.scandir pass: DirEntry carries cached stat() results, so each
+    # file costs one syscall instead of a glob per pattern plus 2 stats each.
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
             try:
-                # Get file modification time
-                file_age_seconds = now - log_file.stat().st_mtime
-                file_age_days = file_age_seconds / (24 * 3600)
+                # Only rotated files (name contains ".log.") are eligible;
+                # one split + dict lookup replaces a per-pattern prefix scan
+                base, sep, _suffix = entry.name.partition(".log.")
+                retention_days = retention_by_base.get(base) if sep else None
+                if retention_days is None or not entry.is_file(follow_symlinks=False):
+                    continue
 
                 # Delete if older than retention period
+                stat_result = entry.stat()
+                file_age_days = (now - stat_result.st_mtime) / (24 * 3600)
                 if file_age_days > retention_days:
-                    file_size = log_file.stat().st_size
-
                     if not dry_run:
-                        log_file.unlink()
+                        os.unlink(entry.path)
 
                     stats["files_deleted"] += 1
-                    stats["bytes_freed"] += file_size
+                    stats["bytes_freed"] += stat_result.st_size
             except Exception as e:
-                stats["errors"].append(f"Error processing {log_file}: {str(e)}")
+                stats["errors"].append(f"Error processing {entry.path}: {str(e)}")
 
     return stats
 
@@ -392,81 +466,191 @@ def cleanup_old_logs(log_dir: Path, dry_run: bool = False) -> Dict[str, Any]:
 # =============================================================================
 
 
+def _compress_one(paths: tuple) -> tuple:
+    """
+    Compress a single log file into the archive (process-pool worker).
+
+    Args:
+        paths: (source_path, archive_path, original_size) tuple; the size
+            comes from the scandir pass so the worker never re-stats the
+            source
+
+    Returns:
+        Tuple of (bytes_before, bytes_after, error_message_or_None)
+    """
+    import gzip
+    import os
+    import shutil
+
+    src, dst, original_size = paths
+    try:
+        # compresslevel=1 is ~4-6x faster than the default (9) on log text
+        # for only a few percent worse ratio; the 1MB buffer amortizes
+        # read/write syscalls.
+        with open(src, "rb") as f_in:
+            with gzip.open(dst, "wb", compresslevel=1) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
+
+        # Verify compressed file exists before deleting original
+        if os.path.exists(dst):
+            compressed_size = os.stat(dst).st_size
+            os.unlink(src)
+            return (original_size, compressed_size, None)
+        return (0, 0, f"Compressed file missing for {src}")
+    except Exception as e:
+        return (0, 0, f"Error archiving {src}: {str(e)}")
+
+
+def _move_one(paths: tuple) -> tuple:
+    """
+    Move a single log file into the archive without compressing it.
+
+    Uses os.sendfile so the copy happens in kernel space with no Python
+    bytes objects materialized, falling back to shutil.copyfileobj where
+    sendfile is unavailable for regular files.
+
+    Args:
+        paths: (source_path, archive_path, size) tuple from the scandir pass
+
+    Returns:
+        Tuple of (bytes_before, bytes_after, error_message_or_None)
+    """
+    import os
+    import shutil
+
+    src, dst, size = paths
+    try:
+        with open(src, "rb") as f_in, open(dst, "wb") as f_out:
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(f_out.fileno(), f_in.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # sendfile may have moved some bytes before failing (and
+                # advanced the destination offset doing so); rewind both
+                # files and truncate the partial copy so the fallback
+                # starts from a clean slate instead of duplicating the
+                # leading bytes
+                f_in.seek(0)
+                f_out.seek(0)
+                f_out.truncate()
+                shutil.copyfileobj(f_in, f_out, length=1024 * 1024)
+
+        # Verify archived file exists before deleting original
+        if os.path.exists(dst):
+            os.unlink(src)
+            return (size, size, None)
+        return (0, 0, f"Archived file missing for {src}")
+    except Exception as e:
+        return (0, 0, f"Error archiving {src}: {str(e)}")
+
+
 def archive_logs(
-    log_dir: Path, archive_dir: Path, dry_run: bool = False
+    log_dir: Path, archive_dir: Path, dry_run: bool = False, compress: bool = True
 ) -> Dict[str, Any]:
     """
     Archive old log files by compressing them.
 
     This function compresses log files older than 7 days to save disk space
-    while maintaining HIPAA compliance.
+    while maintaining HIPAA compliance. With compress=False, files are
+    moved into the archive as-is via a kernel-space copy, for setups where
+    the archive directory is already a cheaper storage tier.
 
     Args:
         log_dir: Directory containing current log files
         archive_dir: Directory to store compressed archives
         dry_run: If True, only report what would be archived
+        compress: If False, move files without gzip compression
 
     Returns:
         Dict with archival statistics
     """
-    import gzip
-    import shutil
+    import fnmatch
+    import os
     import time
+    from concurrent.futures import ProcessPoolExecutor
 
-    stats = {
-        "files_archived": 0,
-        "bytes_before": 0,
-        "bytes_after": 0,
-        "compression_ratio": 0.0,
-        "errors": [],
-    }
-
-    now = time.time()
     archive_threshold_days = 7  # Compress logs older than 7 days
+    # mtime cutoff computed once; entries at or above it are too fresh
+    mtime_threshold = time.time() - archive_threshold_days * 86400
+
+    # Accumulate into locals inside the hot loops; the stats dict is
+    # written once at the end (int adds beat repeated dict stores)
+    files_archived = 0
+    bytes_before = 0
+    bytes_after = 0
+    errors = []
+
+    # Find rotated log files in one scandir pass (cached stat per entry)
+    candidates = []
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            try:
+                # Name checks first: skip already-compressed and non-rotated
+                # files before paying for any stat
+                if entry.name.endswith(".gz"):
+                    continue
+                if not fnmatch.fnmatchcase(entry.name, "*.log.*"):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+
+                # Short-circuit files newer than the archive threshold
+                stat_result = entry.stat()
+                if stat_result.st_mtime >= mtime_threshold:
+                    continue
+
+                if dry_run:
+                    # Dry run - just collect stats
+                    files_archived += 1
+                    bytes_before += stat_result.st_size
+                else:
+                    name = f"{entry.name}.gz" if compress else entry.name
+                    archive_file = archive_dir / name
+                    candidates.append(
+                        (entry.path, str(archive_file), stat_result.st_size)
+                    )
 
-    # Find rotated log files
-    for log_file in log_dir.glob("*.log.*"):
-        try:
-            # Skip if already compressed
-            if log_file.suffix == ".gz":
-                continue
-
-            # Check file age
-            file_age_seconds = now - log_file.stat().st_mtime
-            file_age_days = file_age_seconds / (24 * 3600)
-
-            if file_age_days > archive_threshold_days:
-                # Compress and move to archive
-                archive_file = archive_dir / f"{log_file.name}.gz"
-
-                if not dry_run:
-                    with open(log_file, "rb") as f_in:
-                        with gzip.open(archive_file, "wb") as f_out:
-                            shutil.copyfileobj(f_in, f_out)
-
-                    # Verify compressed file exists before deleting original
-                    if archive_file.exists():
-                        original_size = log_file.stat().st_size
-                        compressed_size = archive_file.stat().st_size
-
-                        log_file.unlink()
+            except Exception as e:
+                errors.append(f"Error archiving {entry.path}: {str(e)}")
+
+    # Compression is CPU-bound and embarrassingly parallel across files, so
+    # fan the candidates out to one worker per core. A single file is not
+    # worth the pool startup cost. Plain moves are I/O-bound and stay
+    # in-process (kernel-space copy via sendfile).
+    if not compress:
+        results = [_move_one(candidate) for candidate in candidates]
+    elif len(candidates) == 1:
+        results = [_compress_one(candidates[0])]
+    elif candidates:
+        max_workers = min(os.cpu_count() or 1, len(candidates))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_compress_one, candidates, chunksize=4))
+    else:
+        results = []
 
-                        stats["files_archived"] += 1
-                        stats["bytes_before"] += original_size
-                        stats["bytes_after"] += compressed_size
-                else:
-                    # Dry run - just collect stats
-                    stats["files_archived"] += 1
-                    stats["bytes_before"] += log_file.stat().st_size
+    for before, after, error in results:
+        if error is not None:
+            errors.append(error)
+        else:
+            files_archived += 1
+            bytes_before += before
+            bytes_after += after
 
-        except Exception as e:
-            stats["errors"].append(f"Error archiving {log_file}: {str(e)}")
+    stats = {
+        "files_archived": files_archived,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "compression_ratio": 0.0,
+        "errors": errors,
+    }
 
-    # Calculate compression ratio
-    if stats["bytes_before"] > 0:
-        stats["compression_ratio"] = (
-            1.0 - (stats["bytes_after"] / stats["bytes_before"])
-        ) * 100
+    # Calculate compression ratio (single float division at the end)
+    if bytes_before > 0:
+        stats["compression_ratio"] = (1.0 - (bytes_after / bytes_before)) * 100
 
     return stats
 
@@ -483,12 +667,29 @@ def get_log_statistics(log_dir: Path) -> Dict[str, Any]:
     Used by management command:
         python manage.py log_stats
 
+    The walk is cached keyed on the directory's mtime, so repeated calls
+    against an unchanged logs directory skip the per-file stat() pass;
+    callers receive a deep copy so downstream mutation cannot poison
+    the cache.
+
     Args:
         log_dir: Directory containing log files
 
     Returns:
         Dict with log statistics
     """
+    import copy
+
+    return copy.deepcopy(
+        _get_log_statistics_cached(str(log_dir), log_dir.stat().st_mtime_ns)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _get_log_statistics_cached(log_dir: str, mtime_ns: int) -> Dict[str, Any]:
+    """Walk log_dir and collect statistics (cached; see get_log_statistics)."""
+    import fnmatch
+    import os
     from datetime import datetime
 
     stats = {
@@ -503,16 +704,22 @@ def get_log_statistics(log_dir: Path) -> Dict[str, Any]:
     oldest_time = None
     newest_time = None
 
-    for log_file in log_dir.glob("*.log*"):
-        if log_file.is_file():
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if not fnmatch.fnmatchcase(entry.name, "*.log*"):
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+
+            # One stat per entry (cached on the DirEntry) covers size + mtime
+            stat_result = entry.stat()
             stats["total_files"] += 1
-            file_size = log_file.stat().st_size
+            file_size = stat_result.st_size
             stats["total_size_bytes"] += file_size
 
             # Track by file type
-            log_type = log_file.stem.split(".")[
-                0
-            ]  # Get base name (e.g., "app" from "app.log.2024-01-15")
+            # Get base name (e.g., "app" from "app.log.2024-01-15")
+            log_type = entry.name.split(".")[0]
             if log_type not in stats["files_by_type"]:
                 stats["files_by_type"][log_type] = {
                     "count": 0,
@@ -522,17 +729,17 @@ def get_log_statistics(log_dir: Path) -> Dict[str, Any]:
             stats["files_by_type"][log_type]["size_bytes"] += file_size
 
             # Track oldest and newest
-            file_time = log_file.stat().st_mtime
+            file_time = stat_result.st_mtime
             if oldest_time is None or file_time < oldest_time:
                 oldest_time = file_time
                 stats["oldest_log"] = {
-                    "name": log_file.name,
+                    "name": entry.name,
                     "date": datetime.fromtimestamp(file_time).isoformat(),
                 }
             if newest_time is None or file_time > newest_time:
                 newest_time = file_time
                 stats["newest_log"] = {
-                    "name": log_file.name,
+                    "name": entry.name,
                     "date": datetime.fromtimestamp(file_time).isoformat(),
                 }
 
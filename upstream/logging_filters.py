@@ -26,6 +26,29 @@ import re
 import logging
 from typing import Pattern, Dict, Any
 
+try:
+    import re2  # google-re2: linear-time matching, immune to catastrophic backtracking
+except ImportError:  # pragma: no cover - optional dependency
+    re2 = None
+
+
+def _compile(pattern: str, flags: int = 0) -> Pattern:
+    """
+    Compile a PHI pattern with google-re2 when available.
+
+    re2's DFA guarantees linear-time matching, so adversarial or very long
+    log messages cannot trigger catastrophic backtracking. Falls back to the
+    stdlib ``re`` module when google-re2 is not installed or the pattern uses
+    a construct re2 does not support.
+    """
+    if re2 is not None:
+        re2_flags = re2.IGNORECASE if flags & re.IGNORECASE else 0
+        try:
+            return re2.compile(pattern, re2_flags)
+        except re2.error:
+            pass
+    return re.compile(pattern, flags)
+
 
 # =============================================================================
 # PHI/PII Detection Patterns
@@ -33,50 +56,82 @@ from typing import Pattern, Dict, Any
 
 # Social Security Number patterns
 SSN_PATTERNS = [
-    re.compile(r'\b\d{3}-\d{2}-\d{4}\b'),  # 123-45-6789
-    re.compile(r'\b\d{9}\b'),              # 123456789 (9 consecutive digits)
+    _compile(r'\b\d{3}-\d{2}-\d{4}\b'),  # 123-45-6789
+    _compile(r'\b\d{9}\b'),              # 123456789 (9 consecutive digits)
 ]
 
 # Medical Record Number patterns (various formats)
 MRN_PATTERNS = [
-    re.compile(r'\b[Mm][Rr][Nn]\s*:?\s*[\w\-]+'),  # MRN: 12345 or mrn:ABC-123
-    re.compile(r'\bmedical[\s_]record[\s_]number\s*:?\s*[\w\-]+', re.IGNORECASE),
+    _compile(r'\b[Mm][Rr][Nn]\s*:?\s*[\w\-]+'),  # MRN: 12345 or mrn:ABC-123
+    _compile(r'\bmedical[\s_]record[\s_]number\s*:?\s*[\w\-]+', re.IGNORECASE),
 ]
 
 # Date of Birth patterns
 DOB_PATTERNS = [
-    re.compile(r'\b[Dd][Oo][Bb]\s*:?\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'),  # DOB: 01/15/1990
-    re.compile(r'\bdate[\s_]of[\s_]birth\s*:?\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', re.IGNORECASE),
+    _compile(r'\b[Dd][Oo][Bb]\s*:?\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}'),  # DOB: 01/15/1990
+    _compile(r'\bdate[\s_]of[\s_]birth\s*:?\s*\d{1,2}[/-]\d{1,2}[/-]\d{2,4}', re.IGNORECASE),
 ]
 
 # Phone Number patterns (US format)
 PHONE_PATTERNS = [
-    re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # 555-123-4567 or 5551234567
-    re.compile(r'\(\d{3}\)\s*\d{3}[-.]?\d{4}'),    # (555) 123-4567
+    _compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b'),  # 555-123-4567 or 5551234567
+    _compile(r'\(\d{3}\)\s*\d{3}[-.]?\d{4}'),    # (555) 123-4567
 ]
 
 # Email Address pattern
-EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_PATTERN = _compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
 
 # Patient Name patterns (context-based)
 PATIENT_NAME_PATTERNS = [
-    re.compile(r'\b[Pp]atient[\s_]name\s*:?\s*[A-Za-z\s\'-]+', re.IGNORECASE),
-    re.compile(r'\b[Nn]ame\s*:?\s*[A-Z][a-z]+\s+[A-Z][a-z]+'),  # Capitalized first/last name
+    _compile(r'\b[Pp]atient[\s_]name\s*:?\s*[A-Za-z\s\'-]+', re.IGNORECASE),
+    _compile(r'\b[Nn]ame\s*:?\s*[A-Z][a-z]+\s+[A-Z][a-z]+'),  # Capitalized first/last name
 ]
 
 # Physical Address patterns
 ADDRESS_PATTERNS = [
-    re.compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct)\.?\b', re.IGNORECASE),
-    re.compile(r'\baddress\s*:?\s*[^\n]+', re.IGNORECASE),
+    _compile(r'\b\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Lane|Ln|Drive|Dr|Court|Ct)\.?\b', re.IGNORECASE),
+    _compile(r'\baddress\s*:?\s*[^\n]+', re.IGNORECASE),
 ]
 
 # Credit Card patterns
 CREDIT_CARD_PATTERNS = [
-    re.compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),  # 1234-5678-9012-3456
+    _compile(r'\b(?:\d{4}[-\s]?){3}\d{4}\b'),  # 1234-5678-9012-3456
 ]
 
 # IP Address pattern (optional - sometimes considered PII)
-IP_ADDRESS_PATTERN = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+IP_ADDRESS_PATTERN = _compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+
+
+# =============================================================================
+# Cheap Literal Prefilter Triggers
+# =============================================================================
+
+# Sentinel: the category can only match if the text contains at least one digit.
+ANY_DIGIT = object()
+
+# For each pattern category, a cheap substring check that must pass before the
+# (much more expensive) regexes are run. Most log messages carry no PHI, so the
+# hot path collapses to a single linear scan of the lowercased message instead
+# of running every compiled regex. A value of None means "no reliable literal
+# trigger exists, always run the regexes"; ANY_DIGIT means "skip unless the
+# text contains a digit". Triggers may over-match (false positive just runs
+# the regex), but must never under-match.
+CATEGORY_TRIGGERS = {
+    'SSN': ANY_DIGIT,
+    'MRN': ('mrn', 'medical'),
+    'DOB': ANY_DIGIT,
+    'PHONE': ANY_DIGIT,
+    'EMAIL': ('@',),
+    'PATIENT_NAME': ('name',),
+    # Must cover every suffix alternative in ADDRESS_PATTERNS: the
+    # spelled-out forms are listed explicitly because 'road', 'lane' and
+    # 'court' do not contain their abbreviations as substrings
+    # ('street'/'avenue'/'boulevard'/'drive' do)
+    'ADDRESS': ('address', 'st', 'ave', 'road', 'rd', 'blvd', 'lane', 'ln',
+                'dr', 'court', 'ct'),
+    'CREDIT_CARD': ANY_DIGIT,
+    'IP_ADDRESS': ANY_DIGIT,
+}
 
 
 # =============================================================================
@@ -146,6 +201,20 @@ class PHIScrubberFilter(logging.Filter):
             'ADDRESS': (ADDRESS_PATTERNS, '[REDACTED_ADDRESS]'),
             'CREDIT_CARD': (CREDIT_CARD_PATTERNS, '[REDACTED_CC]'),
         }
+        self._compile_scan_plan()
+
+    def _compile_scan_plan(self) -> None:
+        """
+        Precompute (trigger, patterns, replacement) tuples for scrub_phi.
+
+        Called whenever self.patterns changes (subclasses add/remove
+        categories in __init__). Categories without a registered trigger
+        always run their regexes.
+        """
+        self._scan_plan = tuple(
+            (CATEGORY_TRIGGERS.get(category), patterns, replacement)
+            for category, (patterns, replacement) in self.patterns.items()
+        )
 
     def filter(self, record: logging.LogRecord) -> bool:
         """
@@ -182,10 +251,21 @@ class PHIScrubberFilter(logging.Filter):
         if not text:
             return text
 
+        # Cheap prefilter: one lowercase copy + linear substring scans decide
+        # which pattern categories could possibly match, so clean messages
+        # (the common case) never pay for the regex engine.
+        text_lower = text.lower()
+        has_digit = any(ch.isdigit() for ch in text)
+
         scrubbed_text = text
 
-        # Apply all patterns
-        for category, (patterns, replacement) in self.patterns.items():
+        for trigger, patterns, replacement in self._scan_plan:
+            if trigger is ANY_DIGIT:
+                if not has_digit:
+                    continue
+            elif trigger is not None:
+                if not any(t in text_lower for t in trigger):
+                    continue
             for pattern in patterns:
                 scrubbed_text = pattern.sub(replacement, scrubbed_text)
 
@@ -220,9 +300,10 @@ class AggressivePHIScrubberFilter(PHIScrubberFilter):
 
         # Add more aggressive name detection
         self.patterns['POTENTIAL_NAME'] = (
-            [re.compile(r'\b[A-Z][a-z]{2,}\s+[A-Z][a-z]{2,}\b')],  # Two capitalized words
+            [_compile(r'\b[A-Z][a-z]{2,}\s+[A-Z][a-z]{2,}\b')],  # Two capitalized words
             '[REDACTED_NAME]'
         )
+        self._compile_scan_plan()
 
 
 class SelectivePHIScrubberFilter(PHIScrubberFilter):
@@ -254,6 +335,7 @@ class SelectivePHIScrubberFilter(PHIScrubberFilter):
             'DOB': (DOB_PATTERNS, '[REDACTED_DOB]'),
             'CREDIT_CARD': (CREDIT_CARD_PATTERNS, '[REDACTED_CC]'),
         }
+        self._compile_scan_plan()
 
 
 # =============================================================================
@@ -23,13 +23,21 @@ JSON Logging (Production):
     All logs pass through PHI scrubbing filters before serialization.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from typing import Any, Dict, Optional
 from contextvars import ContextVar
 from datetime import datetime
 from django.http import HttpRequest
 from pythonjsonlogger import jsonlogger
 
+try:
+    import orjson  # Rust JSON encoder: 3-10x faster than stdlib on log payloads
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 # Thread-local storage for log context
 _log_context: ContextVar[Dict[str, Any]] = ContextVar("log_context", default={})
@@ -199,6 +207,83 @@ def extract_request_context(request: HttpRequest) -> Dict[str, Any]:
     return context
 
 
+class QueuedTimedRotatingFileHandler(logging.handlers.QueueHandler):
+    """
+    TimedRotatingFileHandler fronted by an in-process queue and writer thread.
+
+    The emitting thread only enqueues the record (no formatting, no I/O), so
+    file writes never block request/task threads on the GIL. A QueueListener
+    drains the queue into a small MemoryHandler buffer wrapping the real
+    TimedRotatingFileHandler, amortizing write syscalls across batches of
+    records. WARNING and above flush the buffer immediately, and the buffer
+    is flushed at interpreter shutdown.
+
+    Accepts the same keyword arguments as TimedRotatingFileHandler, so it is
+    a drop-in replacement in the LOGGING dict:
+
+        'app_file': {
+            'class': 'upstream.logging_utils.QueuedTimedRotatingFileHandler',
+            'filename': '/var/log/upstream/app.log',
+            'when': 'midnight',
+            'backupCount': 30,
+            ...
+        }
+    """
+
+    # Records buffered before a single batched write (flushed early on
+    # WARNING+ and at shutdown).
+    buffer_capacity = 64
+
+    def __init__(self, filename, when="h", interval=1, backupCount=0,
+                 encoding=None, delay=False, utc=False, atTime=None):
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        super().__init__(log_queue)
+
+        self.file_handler = logging.handlers.TimedRotatingFileHandler(
+            filename,
+            when=when,
+            interval=interval,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+            utc=utc,
+            atTime=atTime,
+        )
+        self.buffer_handler = logging.handlers.MemoryHandler(
+            capacity=self.buffer_capacity,
+            flushLevel=logging.WARNING,
+            target=self.file_handler,
+            flushOnClose=True,
+        )
+        self.listener = logging.handlers.QueueListener(
+            log_queue, self.buffer_handler, respect_handler_level=False
+        )
+        self.listener.start()
+        atexit.register(self.close)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Pass the record through unchanged.
+
+        The queue never leaves this process, so the base class's defensive
+        copy-and-preformat (done on the emitting thread) is unnecessary;
+        formatting happens on the listener thread instead.
+        """
+        return record
+
+    def setFormatter(self, fmt: Optional[logging.Formatter]) -> None:
+        """Route the formatter to the underlying file handler."""
+        self.file_handler.setFormatter(fmt)
+
+    def close(self) -> None:
+        """Stop the listener, flushing any buffered records."""
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.buffer_handler.close()
+            self.file_handler.close()
+        super().close()
+
+
 class StructuredLogFormatter(logging.Formatter):
     """
     Custom log formatter that outputs structured (key=value) logs.
@@ -211,6 +296,24 @@ class StructuredLogFormatter(logging.Formatter):
         request_id=abc message="Upload complete"
     """
 
+    # Skip the msec concat in logging.Formatter's slow path; sub-second
+    # precision is not part of this format.
+    default_msec_format = None
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """
+        Format the record timestamp, fast-pathing the default layout.
+
+        datetime.isoformat is roughly 2x faster than time.strftime, and this
+        formatter runs for every record on handlers that see all traffic.
+        Custom date formats still go through the stdlib path.
+        """
+        if datefmt is None or datefmt == "%Y-%m-%d %H:%M:%S":
+            return datetime.fromtimestamp(record.created).isoformat(
+                sep=" ", timespec="seconds"
+            )
+        return super().formatTime(record, datefmt)
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record with structured data.
@@ -288,6 +391,40 @@ class JSONLogFormatter(jsonlogger.JsonFormatter):
     PHIScrubberFilter.
     """
 
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format the record, caching the JSON string on the record itself.
+
+        Most loggers fan records into both console and file handlers that
+        share this formatter; caching means the record is serialized once
+        instead of once per handler. Records are single-use, so no
+        invalidation is needed.
+        """
+        cached = getattr(record, "_cached_json", None)
+        if cached is not None:
+            return cached
+        formatted = super().format(record)
+        record._cached_json = formatted
+        return formatted
+
+    def jsonify_log_record(self, log_record: Dict[str, Any]) -> str:
+        """
+        Serialize the log record dict, preferring orjson when installed.
+
+        orjson handles datetime/UUID natively without a ``default=``
+        callback. Falls back to the base class (stdlib json) when orjson is
+        missing or the record contains a type orjson cannot encode.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_record,
+                    option=orjson.OPT_UTC_Z | orjson.OPT_NAIVE_UTC,
+                ).decode("utf-8")
+            except TypeError:
+                pass
+        return super().jsonify_log_record(log_record)
+
     def add_fields(
         self,
         log_record: Dict[str, Any],
@@ -3,6 +3,11 @@ import subprocess
 import json
 from pathlib import Path
 from django.core.management.base import BaseCommand
+
+try:
+    import orjson  # 10x faster than stdlib json on large coverage payloads
+except ImportError:
+    orjson = None
 from django.conf import settings
 from django.utils import timezone
 from upstream.models_agents import AgentRun, TestCoverageReport
@@ -23,33 +28,42 @@ class Command(BaseCommand):
         )
 
         try:
-            # Run pytest with coverage
-            result = subprocess.run(
-                ['pytest', '--cov=upstream', '--cov-report=json', '--cov-report=term'],
-                capture_output=True,
-                text=True,
+            # Run pytest with coverage. Only the JSON report is consumed, so
+            # skip the term report and discard pytest's own output instead of
+            # buffering the whole run's stdout/stderr in memory.
+            subprocess.run(
+                ['pytest', '--cov=upstream', '--cov-report=json'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 cwd=settings.BASE_DIR
             )
 
             # Parse coverage JSON
             coverage_file = settings.BASE_DIR / 'coverage.json'
             if coverage_file.exists():
-                with open(coverage_file) as f:
-                    coverage_data = json.load(f)
+                raw = coverage_file.read_bytes()
+                coverage_data = orjson.loads(raw) if orjson else json.loads(raw)
 
                 overall_coverage = coverage_data.get('totals', {}).get('percent_covered', 0)
 
-                # Store coverage reports
-                for file_path, file_data in coverage_data.get('files', {}).items():
-                    summary = file_data.get('summary', {})
-                    TestCoverageReport.objects.create(
+                # Store coverage reports in one batched INSERT instead of
+                # one round-trip per covered file. The shared empty dict
+                # avoids allocating a fresh default per miss in a loop that
+                # can run 1000+ times.
+                empty = {}
+                reports = [
+                    TestCoverageReport(
                         agent_run=agent_run,
                         file_path=file_path,
                         total_lines=summary.get('num_statements', 0),
                         covered_lines=summary.get('covered_lines', 0),
                         coverage_percentage=summary.get('percent_covered', 0),
-                        missing_lines=file_data.get('missing_lines', []),
+                        missing_lines=file_data.get('missing_lines') or [],
                     )
+                    for file_path, file_data in coverage_data.get('files', empty).items()
+                    for summary in [file_data.get('summary') or empty]
+                ]
+                TestCoverageReport.objects.bulk_create(reports, batch_size=500)
 
                 agent_run.completed_at = timezone.now()
                 agent_run.status = 'completed'
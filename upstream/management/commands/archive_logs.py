@@ -14,9 +14,7 @@ Related: TECH-DEBT Phase 3 - DevOps Monitoring & Metrics
 """
 
 from django.core.management.base import BaseCommand
-from django.conf import settings
-from pathlib import Path
-from upstream.logging_config import archive_logs, get_log_statistics
+from upstream.logging_config import archive_logs, get_log_statistics, get_logs_dir
 
 
 class Command(BaseCommand):
@@ -28,12 +26,17 @@ class Command(BaseCommand):
             action="store_true",
             help="Show what would be archived without actually archiving",
         )
+        parser.add_argument(
+            "--no-compress",
+            action="store_true",
+            help="Move files into the archive without gzip compression",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
 
         # Get log directories
-        log_dir = Path(settings.BASE_DIR) / "logs"
+        log_dir = get_logs_dir()
         archive_dir = log_dir / "archive"
 
         if not log_dir.exists():
@@ -63,7 +66,9 @@ class Command(BaseCommand):
         self.stdout.write(
             "\nArchiving log files older than 7 days (compressing with gzip)..."
         )
-        archive_stats = archive_logs(log_dir, archive_dir, dry_run=dry_run)
+        archive_stats = archive_logs(
+            log_dir, archive_dir, dry_run=dry_run, compress=not options["no_compress"]
+        )
 
         # Display results
         self.stdout.write("\nArchival Results:")
@@ -488,16 +488,12 @@ class Command(BaseCommand):
             )
             findings = auditor.scan()
 
-            # Save findings to database
-            severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-
-            for finding_data in findings:
-                severity = finding_data.get("severity", "medium")
-                severity_counts[severity] = severity_counts.get(severity, 0) + 1
-
-                Finding.objects.create(
+            # Save findings in one batched insert instead of a commit per
+            # finding; bulk_ingest also defers secondary indexes on large runs
+            Finding.objects.bulk_ingest([
+                Finding(
                     agent_run=agent_run,
-                    severity=severity,
+                    severity=finding_data.get("severity", "medium"),
                     category=finding_data["category"],
                     title=finding_data["title"],
                     description=finding_data["description"],
@@ -506,15 +502,13 @@ class Command(BaseCommand):
                     code_snippet=finding_data.get("code_snippet", ""),
                     recommendation=finding_data.get("recommendation", ""),
                 )
+                for finding_data in findings
+            ])
 
-            # Update agent run
+            # Update agent run: one aggregate for the counters, one UPDATE
             agent_run.completed_at = timezone.now()
             agent_run.status = "completed"
-            agent_run.findings_count = len(findings)
-            agent_run.critical_count = severity_counts.get("critical", 0)
-            agent_run.high_count = severity_counts.get("high", 0)
-            agent_run.medium_count = severity_counts.get("medium", 0)
-            agent_run.low_count = severity_counts.get("low", 0)
+            agent_run.recompute_counts(save=False)
             agent_run.save()
 
             # Print summary
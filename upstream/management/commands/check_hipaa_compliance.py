@@ -1,10 +1,14 @@
 """HIPAA Compliance Monitor Command"""
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from upstream.models_agents import AgentRun, Finding
 from upstream.utils import detect_phi
 
+# Known-PHI self-test input for check_phi_detection
+_PHI_SELFTEST = "Patient John Smith"
+
 
 class HIPAAComplianceChecker:
     """Check HIPAA compliance across the application"""
@@ -75,7 +79,7 @@ class HIPAAComplianceChecker:
         print("✓ Checking PHI detection...")
 
         # Test PHI detection works
-        has_phi, msg = detect_phi("Patient John Smith")
+        has_phi, msg = detect_phi(_PHI_SELFTEST)
         if not has_phi:
             self.violations.append({
                 'severity': 'critical',
@@ -121,26 +125,29 @@ class Command(BaseCommand):
             checker = HIPAAComplianceChecker()
             violations = checker.check_all()
 
-            # Save violations
-            critical_count = 0
-            for violation in violations:
-                if violation['severity'] == 'critical':
-                    critical_count += 1
-
-                Finding.objects.create(
-                    agent_run=agent_run,
-                    severity=violation['severity'],
-                    category=violation['category'],
-                    title=violation['title'],
-                    description=violation['description'],
-                    recommendation=violation['recommendation'],
-                )
-
-            agent_run.completed_at = timezone.now()
-            agent_run.status = 'completed'
-            agent_run.findings_count = len(violations)
-            agent_run.critical_count = critical_count
-            agent_run.save()
+            # Save violations in one batched INSERT; one transaction covers
+            # the findings and the run update instead of a commit per write
+            critical_count = sum(
+                1 for violation in violations if violation['severity'] == 'critical'
+            )
+            with transaction.atomic():
+                Finding.objects.bulk_create([
+                    Finding(
+                        agent_run=agent_run,
+                        severity=violation['severity'],
+                        category=violation['category'],
+                        title=violation['title'],
+                        description=violation['description'],
+                        recommendation=violation['recommendation'],
+                    )
+                    for violation in violations
+                ], batch_size=100, ignore_conflicts=True)
+
+                agent_run.completed_at = timezone.now()
+                agent_run.status = 'completed'
+                agent_run.findings_count = len(violations)
+                agent_run.critical_count = critical_count
+                agent_run.save()
 
             # Print summary
             print("\n" + "━" * 50)
@@ -1,15 +1,23 @@
 """Migration Safety Checker Command"""
 from django.core.management.base import BaseCommand
-from django.db.migrations.loader import MigrationLoader
-from django.db import connection
+from django.db import transaction
 from django.utils import timezone
 from upstream.models_agents import AgentRun, MigrationAnalysis
 
+# Risk classification by operation class name
+_DESTRUCTIVE = frozenset({'DeleteModel', 'RunSQL'})
+_HIGH_RISK = frozenset({'RemoveField', 'AlterField'})
+_CAUTION = frozenset({'RenameField', 'AlterModelTable'})
+
 
 class Command(BaseCommand):
     help = 'Check migration safety before running'
 
     def handle(self, *args, **options):
+        # Deferred so loading the command (help, autocompletion) stays cheap
+        from django.db import connection
+        from django.db.migrations.loader import MigrationLoader
+
         agent_run = AgentRun.objects.create(
             agent_type='migration_safety',
             trigger='manual',
@@ -30,19 +38,19 @@ class Command(BaseCommand):
             print(f"\nAnalyzing {len(pending)} pending migrations...\n")
 
             high_risk_count = 0
+            analyses = []
 
             for app_name, migration_name, migration in pending:
-                risk = self._assess_risk(migration)
                 operations = [op.__class__.__name__ for op in migration.operations]
+                risk = self._assess_risk(operations)
 
-                # Save analysis
-                MigrationAnalysis.objects.create(
+                analyses.append(MigrationAnalysis(
                     agent_run=agent_run,
                     migration_file=f"{app_name}/{migration_name}",
                     risk_level=risk,
                     operations=operations,
                     rollback_possible=self._check_reversible(migration),
-                )
+                ))
 
                 # Print
                 risk_icon = {'safe': '✅', 'caution': '⚠️', 'high_risk': '🔥', 'destructive': '☢️'}
@@ -53,11 +61,18 @@ class Command(BaseCommand):
                     high_risk_count += 1
                     print(f"   ⚠️  DATA LOSS RISK!")
 
-            agent_run.completed_at = timezone.now()
-            agent_run.status = 'completed'
-            agent_run.findings_count = len(pending)
-            agent_run.critical_count = high_risk_count
-            agent_run.save()
+            # Save analyses in one batched INSERT; one transaction covers
+            # the analyses and the run update instead of a commit per write
+            with transaction.atomic():
+                MigrationAnalysis.objects.bulk_create(
+                    analyses, batch_size=100, ignore_conflicts=True
+                )
+
+                agent_run.completed_at = timezone.now()
+                agent_run.status = 'completed'
+                agent_run.findings_count = len(pending)
+                agent_run.critical_count = high_risk_count
+                agent_run.save()
 
             if high_risk_count > 0:
                 self.stdout.write(self.style.ERROR(
@@ -74,20 +89,18 @@ class Command(BaseCommand):
             agent_run.save()
             raise
 
-    def _assess_risk(self, migration):
-        """Assess migration risk level"""
-        operations = [op.__class__.__name__ for op in migration.operations]
-
+    def _assess_risk(self, operations):
+        """Assess migration risk level from its operation class names"""
         # Destructive operations
-        if any(op in operations for op in ['DeleteModel', 'RunSQL']):
+        if _DESTRUCTIVE.intersection(operations):
             return 'destructive'
 
         # High risk
-        if any(op in operations for op in ['RemoveField', 'AlterField']):
+        if _HIGH_RISK.intersection(operations):
             return 'high_risk'
 
         # Caution
-        if any(op in operations for op in ['RenameField', 'AlterModelTable']):
+        if _CAUTION.intersection(operations):
             return 'caution'
 
         # Safe
@@ -95,7 +108,4 @@ class Command(BaseCommand):
 
     def _check_reversible(self, migration):
         """Check if migration is reversible"""
-        for operation in migration.operations:
-            if not operation.reversible:
-                return False
-        return True
+        return all(op.reversible for op in migration.operations)
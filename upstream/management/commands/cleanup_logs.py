@@ -16,9 +16,7 @@ Related: TECH-DEBT Phase 3 - DevOps Monitoring & Metrics
 """
 
 from django.core.management.base import BaseCommand
-from django.conf import settings
-from pathlib import Path
-from upstream.logging_config import cleanup_old_logs, get_log_statistics
+from upstream.logging_config import cleanup_old_logs, get_log_statistics, get_logs_dir
 
 
 class Command(BaseCommand):
@@ -35,7 +33,7 @@ class Command(BaseCommand):
         dry_run = options["dry_run"]
 
         # Get log directory
-        log_dir = Path(settings.BASE_DIR) / "logs"
+        log_dir = get_logs_dir()
 
         if not log_dir.exists():
             self.stdout.write(
@@ -80,12 +78,17 @@ class Command(BaseCommand):
         else:
             self.stdout.write(self.style.SUCCESS("\nNo errors encountered"))
 
-        # Show statistics after cleanup
+        # Show statistics after cleanup. Derived from the "before" snapshot
+        # plus the cleanup counters, so we don't walk the directory twice.
         if not dry_run:
             self.stdout.write("\nLog statistics after cleanup:")
-            stats_after = get_log_statistics(log_dir)
-            self.stdout.write(f"  Total files: {stats_after['total_files']}")
-            self.stdout.write(f"  Total size: {stats_after['total_size_mb']:.2f} MB")
+            files_after = stats_before["total_files"] - cleanup_stats["files_deleted"]
+            size_after_mb = (
+                stats_before["total_size_mb"]
+                - cleanup_stats["bytes_freed"] / (1024 * 1024)
+            )
+            self.stdout.write(f"  Total files: {files_after}")
+            self.stdout.write(f"  Total size: {size_after_mb:.2f} MB")
 
         if dry_run:
             self.stdout.write(
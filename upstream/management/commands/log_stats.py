@@ -14,9 +14,7 @@ Related: TECH-DEBT Phase 3 - DevOps Monitoring & Metrics
 """
 
 from django.core.management.base import BaseCommand
-from django.conf import settings
-from pathlib import Path
-from upstream.logging_config import get_log_statistics, get_log_retention_days
+from upstream.logging_config import get_log_statistics, get_log_retention_days, get_logs_dir
 
 
 class Command(BaseCommand):
@@ -24,7 +22,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **options):
         # Get log directory
-        log_dir = Path(settings.BASE_DIR) / "logs"
+        log_dir = get_logs_dir()
 
         if not log_dir.exists():
             self.stdout.write(
@@ -23,8 +23,14 @@ Related: Phase 3 - DevOps Monitoring & Metrics (Task #5)
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
 from io import StringIO
+import re
 import sys
 
+# Classifies a check-output line by severity in a single scan, covering both
+# the "ERROR ..." prefix form and the ": (monitoring.E001)" check-id form
+_CHECK_RE = re.compile(r"^(ERROR|WARNING|INFO)\b|: \(monitoring\.([EWI])\d")
+_KIND_BY_CODE = {"E": "ERROR", "W": "WARNING", "I": "INFO"}
+
 
 class Command(BaseCommand):
     help = "Validate monitoring and observability configuration"
@@ -68,57 +74,53 @@ class Command(BaseCommand):
         # Parse results
         lines = check_output.split("\n")
 
-        error_count = 0
-        warning_count = 0
-        info_count = 0
-
         errors = []
         warnings = []
         infos = []
+        buckets = {"ERROR": errors, "WARNING": warnings, "INFO": infos}
 
         for line in lines:
-            if not line.strip():
+            match = _CHECK_RE.search(line)
+            if not match:
                 continue
+            kind = match.group(1) or _KIND_BY_CODE[match.group(2)]
+            buckets[kind].append(line)
 
-            if line.startswith("ERROR") or ": (monitoring.E" in line:
-                error_count += 1
-                errors.append(line)
-            elif line.startswith("WARNING") or ": (monitoring.W" in line:
-                warning_count += 1
-                warnings.append(line)
-            elif line.startswith("INFO") or ": (monitoring.I" in line:
-                info_count += 1
-                infos.append(line)
-
-        # Display results
+        error_count = len(errors)
+        warning_count = len(warnings)
+        info_count = len(infos)
+
+        # Display results. Output is accumulated and flushed in one write so
+        # large check runs don't pay a syscall per finding.
+        out = []
         if errors:
-            self.stdout.write(f"\n{self.style.ERROR('ERRORS')} ({error_count}):")
+            out.append(f"\n{self.style.ERROR('ERRORS')} ({error_count}):")
             for error in errors:
-                self.stdout.write(f"  {self.style.ERROR('✗')} {error}")
+                out.append(f"  {self.style.ERROR('✗')} {error}")
 
         if warnings:
-            self.stdout.write(f"\n{self.style.WARNING('WARNINGS')} ({warning_count}):")
+            out.append(f"\n{self.style.WARNING('WARNINGS')} ({warning_count}):")
             for warning in warnings:
-                self.stdout.write(f"  {self.style.WARNING('⚠')} {warning}")
+                out.append(f"  {self.style.WARNING('⚠')} {warning}")
 
         if infos:
-            self.stdout.write(f"\n{self.style.SUCCESS('INFO')} ({info_count}):")
+            out.append(f"\n{self.style.SUCCESS('INFO')} ({info_count}):")
             for info in infos:
-                self.stdout.write(f"  {self.style.SUCCESS('ℹ')} {info}")
+                out.append(f"  {self.style.SUCCESS('ℹ')} {info}")
 
         # Summary
-        self.stdout.write("\n" + "=" * 60)
-        self.stdout.write("Summary:")
-        self.stdout.write(f"  Errors:   {error_count}")
-        self.stdout.write(f"  Warnings: {warning_count}")
-        self.stdout.write(f"  Info:     {info_count}")
+        out.append("\n" + "=" * 60)
+        out.append("Summary:")
+        out.append(f"  Errors:   {error_count}")
+        out.append(f"  Warnings: {warning_count}")
+        out.append(f"  Info:     {info_count}")
 
         # Get monitoring status
         from upstream.monitoring_checks import get_monitoring_status
 
         status = get_monitoring_status()
 
-        self.stdout.write("\nMonitoring Components:")
+        out.append("\nMonitoring Components:")
         for component, is_healthy in status.items():
             if component == "overall_status":
                 continue
@@ -136,7 +138,9 @@ class Command(BaseCommand):
                 style = self.style.ERROR
                 status_text = "unhealthy"
 
-            self.stdout.write(f"  {style(icon)} {component}: {status_text}")
+            out.append(f"  {style(icon)} {component}: {status_text}")
+
+        self.stdout.write("\n".join(out))
 
         # Overall status
         overall = status["overall_status"]
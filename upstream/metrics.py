@@ -13,198 +13,380 @@ Usage:
     # Increment counter
     alert_created.labels(product='DriftWatch', severity='high').inc()
 
-    # Set gauge value
-    data_quality_score.labels(customer='Acme Corp').set(0.95)
+    # Observe a score
+    data_quality_score.labels(metric_type='completeness').observe(0.95)
 
     # Time operations
     with alert_processing_time.labels(product='DelayGuard').time():
         process_alert(...)
 
+Metrics deliberately carry no customer_id label: per-tenant labels multiply
+every time series by the customer count, which bloats scrape payloads and
+Prometheus head memory. Per-customer attribution lives in structured logs
+instead (the track_* helpers emit one debug record per event).
+
 Related to DEVOPS-MEDIUM: Custom business metrics for operational visibility.
 """
 
-from prometheus_client import Counter, Gauge, Histogram
+from django.conf import settings
+from django.core.signals import request_finished
+from prometheus_client import REGISTRY, Counter, Histogram
+import atexit
+import functools
 import logging
+import re
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Histogram buckets are settings-overridable so operators can retune them
+# without a code change. Each boundary costs one _bucket series per label
+# combination, so the defaults stay deliberately coarse.
+#
+# Histograms measuring the same kind of duration share one default tuple:
+# one object instead of per-metric copies, and a diverging bucket shape
+# has to be an explicit, visible choice.
+_SECONDS_BUCKETS_MEDIUM = (5.0, 30.0, 120.0, 600.0)
+
+ALERT_BUCKETS = tuple(
+    getattr(settings, "UPSTREAM_ALERT_BUCKETS", (0.5, 2.0, 10.0, 60.0))
+)
+DRIFT_BUCKETS = tuple(
+    getattr(settings, "UPSTREAM_DRIFT_BUCKETS", _SECONDS_BUCKETS_MEDIUM)
+)
+INGESTION_BUCKETS = tuple(
+    getattr(settings, "UPSTREAM_INGESTION_BUCKETS", (1.0, 10.0, 60.0, 300.0))
+)
+# Job durations span three orders of magnitude (seconds to an hour), so
+# the default boundaries are exponentially spaced (roughly x4 per step) —
+# linear steps at this range either miss the tail or cost a series apiece
+JOB_BUCKETS = tuple(
+    getattr(
+        settings,
+        "UPSTREAM_JOB_BUCKETS",
+        (1.0, 4.0, 15.0, 60.0, 240.0, 900.0, 3600.0),
+    )
+)
+REPORT_BUCKETS = tuple(
+    getattr(settings, "UPSTREAM_REPORT_BUCKETS", _SECONDS_BUCKETS_MEDIUM)
+)
+
+# Where a metric genuinely needs tenant breakdown, customers are folded into
+# a fixed number of hash buckets so series count stays constant no matter
+# how many tenants exist
+CUSTOMER_BUCKET_COUNT = getattr(settings, "UPSTREAM_CUSTOMER_BUCKET_COUNT", 32)
+
+# Bucket label strings precomputed once; the hot path does a modulo and a
+# tuple index instead of formatting a new string per emission
+_CUSTOMER_BUCKET_LABELS = tuple(
+    f"b{bucket:02d}" for bucket in range(CUSTOMER_BUCKET_COUNT)
+)
+
+# Global kill switch for business metrics (load tests, local profiling).
+# Bound once at import: the helpers check a module constant instead of
+# paying a settings lookup or a try/except per emission.
+METRICS_ENABLED = getattr(settings, "UPSTREAM_METRICS_ENABLED", True)
+
+
+def customer_bucket(customer_id: int) -> str:
+    """Map a customer ID onto one of CUSTOMER_BUCKET_COUNT label values."""
+    return _CUSTOMER_BUCKET_LABELS[customer_id % CUSTOMER_BUCKET_COUNT]
+
+
+def _get_or_create(metric_cls, name, documentation, labelnames=(), **kwargs):
+    """
+    Construct a metric, reusing the registered one if the name is taken.
+
+    Module-level definitions touch prometheus_client's global REGISTRY at
+    import time; if this module body runs twice in one interpreter (worker
+    forks importing under a second path, test harnesses resetting
+    sys.modules), the second construction would raise a duplicate-name
+    ValueError. Reusing the existing collector makes re-execution a no-op
+    instead of a crash, and skips the redundant registration work.
+    """
+    try:
+        return metric_cls(name, documentation, labelnames, **kwargs)
+    except ValueError:
+        return REGISTRY._names_to_collectors[name]
+
+
 # =============================================================================
 # Alert Metrics
 # =============================================================================
 
-alert_created = Counter(
+alert_created = _get_or_create(
+    Counter,
     "upstream_alert_created_total",
     "Total number of alert events created",
-    ["product", "severity", "customer_id"],
+    ["product", "severity"],
 )
 
-alert_delivered = Counter(
+alert_delivered = _get_or_create(
+    Counter,
     "upstream_alert_delivered_total",
     "Total number of alert notifications delivered",
-    ["product", "channel_type", "customer_id"],
+    ["product", "channel_type"],
 )
 
-alert_failed = Counter(
+alert_failed = _get_or_create(
+    Counter,
     "upstream_alert_failed_total",
     "Total number of alert notification failures",
-    ["product", "channel_type", "error_type", "customer_id"],
+    ["product", "channel_type", "error_type"],
 )
 
-alert_processing_time = Histogram(
+alert_processing_time = _get_or_create(
+    Histogram,
     "upstream_alert_processing_seconds",
     "Time spent processing and sending alerts",
     ["product"],
-    buckets=(0.1, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0),
+    buckets=ALERT_BUCKETS,
 )
 
-alert_suppressed = Counter(
+alert_suppressed = _get_or_create(
+    Counter,
     "upstream_alert_suppressed_total",
     "Total number of alerts suppressed due to cooldown or noise patterns",
-    ["product", "reason", "customer_id"],
+    ["product", "reason"],
 )
 
 # =============================================================================
 # Drift Detection Metrics
 # =============================================================================
 
-drift_event_detected = Counter(
+# severity_level is a documented bounded label set: raw severity floats must
+# never reach .labels() (each distinct float would mint a new series)
+DRIFT_SEVERITY_LEVELS = ("high", "medium", "low")
+
+drift_event_detected = _get_or_create(
+    Counter,
     "upstream_drift_event_detected_total",
     "Total number of drift events detected",
-    ["product", "drift_type", "severity_level", "customer_id"],
+    ["product", "drift_type", "severity_level"],
 )
 
-drift_computation_time = Histogram(
+drift_computation_time = _get_or_create(
+    Histogram,
     "upstream_drift_computation_seconds",
     "Time spent computing drift signals",
     ["product"],
-    buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+    buckets=DRIFT_BUCKETS,
 )
 
-payment_delay_signal_created = Counter(
+payment_delay_signal_created = _get_or_create(
+    Counter,
     "upstream_payment_delay_signal_total",
     "Total number of payment delay signals created",
-    ["severity", "customer_id"],
+    ["severity"],
 )
 
-denial_signal_created = Counter(
+denial_signal_created = _get_or_create(
+    Counter,
     "upstream_denial_signal_total",
     "Total number of denial signals created",
-    ["signal_type", "customer_id"],
+    ["signal_type"],
 )
 
 # =============================================================================
 # Data Quality Metrics
 # =============================================================================
 
-data_quality_score = Gauge(
+# Histogram rather than a per-tenant Gauge: gauge series live in the TSDB
+# head forever, while bucketed scores aggregate across tenants via
+# histogram_quantile at O(buckets) cardinality
+data_quality_score = _get_or_create(
+    Histogram,
     "upstream_data_quality_score",
-    "Current data quality score (0.0-1.0)",
-    ["customer_id", "metric_type"],
+    "Distribution of data quality scores (0.0-1.0)",
+    ["metric_type"],
+    buckets=(0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0),
 )
 
-data_quality_check_failed = Counter(
+data_quality_check_failed = _get_or_create(
+    Counter,
     "upstream_data_quality_check_failed_total",
     "Total number of failed data quality checks",
-    ["check_type", "severity", "customer_id"],
+    ["check_type", "severity"],
 )
 
-claim_records_ingested = Counter(
+# Ingestion volume is the one metric operators slice per tenant; the
+# customer_bucket label keeps that at bounded cardinality
+claim_records_ingested = _get_or_create(
+    Counter,
     "upstream_claim_records_ingested_total",
     "Total number of claim records ingested",
-    ["customer_id", "status"],
+    ["status", "customer_bucket"],
 )
 
-ingestion_processing_time = Histogram(
+ingestion_processing_time = _get_or_create(
+    Histogram,
     "upstream_ingestion_processing_seconds",
     "Time spent processing ingestion batches",
-    ["customer_id"],
-    buckets=(0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+    buckets=INGESTION_BUCKETS,
 )
 
 # =============================================================================
 # Background Job Metrics
 # =============================================================================
 
-background_job_started = Counter(
+background_job_started = _get_or_create(
+    Counter,
     "upstream_background_job_started_total",
     "Total number of background jobs started",
-    ["job_type", "customer_id"],
+    ["job_type"],
 )
 
-background_job_completed = Counter(
+background_job_completed = _get_or_create(
+    Counter,
     "upstream_background_job_completed_total",
     "Total number of background jobs completed successfully",
-    ["job_type", "customer_id"],
+    ["job_type"],
 )
 
-background_job_failed = Counter(
+background_job_failed = _get_or_create(
+    Counter,
     "upstream_background_job_failed_total",
     "Total number of background jobs that failed",
-    ["job_type", "error_type", "customer_id"],
+    ["job_type", "error_type"],
 )
 
-background_job_duration = Histogram(
+background_job_duration = _get_or_create(
+    Histogram,
     "upstream_background_job_duration_seconds",
     "Duration of background job execution",
     ["job_type"],
-    buckets=(1.0, 5.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0),
+    buckets=JOB_BUCKETS,
 )
 
 # =============================================================================
 # Report Generation Metrics
 # =============================================================================
 
-report_generated = Counter(
+report_generated = _get_or_create(
+    Counter,
     "upstream_report_generated_total",
     "Total number of reports generated",
-    ["report_type", "customer_id"],
+    ["report_type"],
 )
 
-report_generation_time = Histogram(
+report_generation_time = _get_or_create(
+    Histogram,
     "upstream_report_generation_seconds",
     "Time spent generating reports",
     ["report_type"],
-    buckets=(1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0),
+    buckets=REPORT_BUCKETS,
 )
 
-report_generation_failed = Counter(
+report_generation_failed = _get_or_create(
+    Counter,
     "upstream_report_generation_failed_total",
     "Total number of report generation failures",
-    ["report_type", "error_type", "customer_id"],
+    ["report_type", "error_type"],
 )
 
 # =============================================================================
 # API Metrics (Supplementing django-prometheus)
 # =============================================================================
 
-api_endpoint_custom_metric = Counter(
+# The endpoint label must always be a URL *pattern* (resolver_match.route),
+# never a raw request path: raw paths embed object IDs and would mint a
+# series per ID. Use track_api_endpoint / track_api_rate_limit, which
+# normalize through _normalize_endpoint, instead of calling .labels()
+# directly with request.path.
+api_endpoint_custom_metric = _get_or_create(
+    Counter,
     "upstream_api_endpoint_calls_total",
     "Custom tracking of specific API endpoints",
-    ["endpoint", "method", "customer_id"],
+    ["endpoint", "method"],
 )
 
-api_rate_limit_hit = Counter(
+api_rate_limit_hit = _get_or_create(
+    Counter,
     "upstream_api_rate_limit_hit_total",
     "Number of times API rate limits were hit",
-    ["endpoint", "throttle_class", "customer_id"],
+    ["endpoint", "throttle_class"],
 )
 
 # =============================================================================
 # Cache Metrics
 # =============================================================================
 
-cache_hit = Counter(
-    "upstream_cache_hit_total", "Total number of cache hits", ["cache_key_prefix"]
-)
-
-cache_miss = Counter(
-    "upstream_cache_miss_total", "Total number of cache misses", ["cache_key_prefix"]
+# Hits and misses share one metric name with an outcome label: hit ratio
+# is then a plain PromQL ratio over the same series family
+# (rate(...{outcome="hit"}) / rate(...)) instead of joining two metrics
+cache_access = _get_or_create(
+    Counter,
+    "upstream_cache_access_total",
+    "Total number of cache accesses",
+    ["cache_key_prefix", "outcome"],
 )
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# error_type is a bounded label set: passing raw exception class names (or
+# worse, messages) into .labels() would mint one series per exception type
+# ever seen in production
+_ERROR_TYPES = frozenset(
+    {"timeout", "auth", "network", "validation", "rate_limited", "unknown"}
+)
+
+# Common exception class names folded onto the bounded set, so call sites
+# can keep passing e.__class__.__name__
+_ERROR_TYPE_BY_EXCEPTION = {
+    "TimeoutError": "timeout",
+    "SoftTimeLimitExceeded": "timeout",
+    "ConnectionError": "network",
+    "ConnectionResetError": "network",
+    "OSError": "network",
+    "PermissionError": "auth",
+    "AuthenticationFailed": "auth",
+    "ValidationError": "validation",
+    "ValueError": "validation",
+}
+
+
+def normalize_error_type(error_type: str) -> str:
+    """Clamp an error label value onto the bounded _ERROR_TYPES set."""
+    if error_type in _ERROR_TYPES:
+        return error_type
+    return _ERROR_TYPE_BY_EXCEPTION.get(error_type, "unknown")
+
+
+# Cached child-metric accessors: metric.labels() takes an internal lock and
+# a dict lookup per call, so the hot track_* paths resolve each label tuple
+# to its child once and reuse it.
+
+
+@functools.lru_cache(maxsize=256)
+def _alert_created_child(product: str, severity: str):
+    return alert_created.labels(product=product, severity=severity)
+
+
+@functools.lru_cache(maxsize=256)
+def _alert_delivered_child(product: str, channel_type: str):
+    return alert_delivered.labels(product=product, channel_type=channel_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _drift_event_child(product: str, drift_type: str, severity_level: str):
+    if severity_level not in DRIFT_SEVERITY_LEVELS:
+        raise ValueError(f"Unknown drift severity level: {severity_level!r}")
+    return drift_event_detected.labels(
+        product=product, drift_type=drift_type, severity_level=severity_level
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _data_quality_score_child(metric_type: str):
+    return data_quality_score.labels(metric_type=metric_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _claim_records_ingested_child(status: str, bucket: str):
+    return claim_records_ingested.labels(status=status, customer_bucket=bucket)
+
 
 def track_alert_created(product: str, severity: str, customer_id: int):
     """
@@ -213,14 +395,15 @@ def track_alert_created(product: str, severity: str, customer_id: int):
     Args:
         product: Product name (DriftWatch, DelayGuard, DenialScope)
         severity: Alert severity level
-        customer_id: Customer ID
+        customer_id: Customer ID (logged, not a metric label)
     """
-    try:
-        alert_created.labels(
-            product=product, severity=severity, customer_id=str(customer_id)
-        ).inc()
-    except Exception as e:
-        logger.warning(f"Failed to track alert_created metric: {e}")
+    if not METRICS_ENABLED:
+        return
+    _alert_created_child(product, severity).inc()
+    logger.debug(
+        "alert_created",
+        extra={"product": product, "severity": severity, "customer_id": customer_id},
+    )
 
 
 def track_alert_delivered(product: str, channel_type: str, customer_id: int):
@@ -230,14 +413,19 @@ def track_alert_delivered(product: str, channel_type: str, customer_id: int):
     Args:
         product: Product name
         channel_type: Notification channel (email, slack, webhook)
-        customer_id: Customer ID
+        customer_id: Customer ID (logged, not a metric label)
     """
-    try:
-        alert_delivered.labels(
-            product=product, channel_type=channel_type, customer_id=str(customer_id)
-        ).inc()
-    except Exception as e:
-        logger.warning(f"Failed to track alert_delivered metric: {e}")
+    if not METRICS_ENABLED:
+        return
+    _alert_delivered_child(product, channel_type).inc()
+    logger.debug(
+        "alert_delivered",
+        extra={
+            "product": product,
+            "channel_type": channel_type,
+            "customer_id": customer_id,
+        },
+    )
 
 
 def track_drift_event(product: str, drift_type: str, severity: float, customer_id: int):
@@ -248,56 +436,233 @@ def track_drift_event(product: str, drift_type: str, severity: float, customer_i
         product: Product name
         drift_type: Type of drift detected
         severity: Severity value (0.0-1.0)
-        customer_id: Customer ID
+        customer_id: Customer ID (logged, not a metric label)
     """
-    try:
-        # Categorize severity
-        if severity >= 0.7:
-            severity_level = "high"
-        elif severity >= 0.4:
-            severity_level = "medium"
-        else:
-            severity_level = "low"
-
-        drift_event_detected.labels(
-            product=product,
-            drift_type=drift_type,
-            severity_level=severity_level,
-            customer_id=str(customer_id),
-        ).inc()
-    except Exception as e:
-        logger.warning(f"Failed to track drift_event_detected metric: {e}")
+    if not METRICS_ENABLED:
+        return
+    # Bin severity into the bounded DRIFT_SEVERITY_LEVELS label set
+    severity_level = (
+        "high" if severity >= 0.7 else ("medium" if severity >= 0.4 else "low")
+    )
+    _drift_event_child(product, drift_type, severity_level).inc()
+    logger.debug(
+        "drift_event_detected",
+        extra={
+            "product": product,
+            "drift_type": drift_type,
+            "severity_level": severity_level,
+            "customer_id": customer_id,
+        },
+    )
 
 
 def track_data_quality_score(customer_id: int, metric_type: str, score: float):
     """
-    Set current data quality score.
+    Record a data quality score observation.
 
     Args:
-        customer_id: Customer ID
+        customer_id: Customer ID (logged, not a metric label)
         metric_type: Type of quality metric (completeness, accuracy, timeliness)
         score: Quality score (0.0-1.0)
     """
-    try:
-        data_quality_score.labels(
-            customer_id=str(customer_id), metric_type=metric_type
-        ).set(score)
-    except Exception as e:
-        logger.warning(f"Failed to track data_quality_score metric: {e}")
+    if not METRICS_ENABLED:
+        return
+    _data_quality_score_child(metric_type).observe(score)
+    logger.debug(
+        "data_quality_score",
+        extra={
+            "metric_type": metric_type,
+            "score": score,
+            "customer_id": customer_id,
+        },
+    )
+
+
+# Safety net for endpoint labels that arrive by a path other than
+# resolver_match.route: runs of 2+ digits are almost certainly object IDs
+# (single digits appear in legitimate templates like "api/v1/")
+_ID_RUN_RE = re.compile(r"\d{2,}")
+
+
+def _normalize_endpoint(request) -> str:
+    """
+    Resolve a request to its URL pattern template.
+
+    Returns resolver_match.route ("customers/<int:pk>/uploads/") so the
+    endpoint label is bounded by the number of URL patterns, never the
+    raw path. Falls back to "unknown" when the request was not resolved.
+    """
+    match = getattr(request, "resolver_match", None)
+    route = getattr(match, "route", "") if match is not None else ""
+    if not route:
+        return "unknown"
+    return _ID_RUN_RE.sub("<id>", route)
+
+
+def track_api_endpoint(request):
+    """
+    Track a call to an API endpoint worth watching individually.
+
+    Args:
+        request: Django request; the endpoint label comes from its
+            resolved URL pattern, not the raw path
+    """
+    if not METRICS_ENABLED:
+        return
+    api_endpoint_custom_metric.labels(
+        endpoint=_normalize_endpoint(request), method=request.method
+    ).inc()
+
+
+def track_api_rate_limit(request, throttle_class: str):
+    """
+    Track a request rejected by rate limiting.
+
+    Args:
+        request: Django request; the endpoint label comes from its
+            resolved URL pattern, not the raw path
+        throttle_class: Name of the throttle class that rejected it
+    """
+    if not METRICS_ENABLED:
+        return
+    api_rate_limit_hit.labels(
+        endpoint=_normalize_endpoint(request), throttle_class=throttle_class
+    ).inc()
+
+
+def track_cache(cache_key_prefix: str, hit: bool):
+    """
+    Track a cache access.
+
+    Args:
+        cache_key_prefix: Stable key prefix identifying the cache use
+        hit: Whether the lookup found a value
+    """
+    if not METRICS_ENABLED:
+        return
+    cache_access.labels(
+        cache_key_prefix=cache_key_prefix, outcome="hit" if hit else "miss"
+    ).inc()
+
+
+def track_alert_failed(
+    product: str, channel_type: str, error_type: str, customer_id: int
+):
+    """
+    Track a failed alert delivery.
+
+    Args:
+        product: Product name
+        channel_type: Notification channel (email, slack, webhook)
+        error_type: Error category or exception class name (clamped onto
+            the bounded _ERROR_TYPES label set; raw value is logged)
+        customer_id: Customer ID (logged, not a metric label)
+    """
+    if not METRICS_ENABLED:
+        return
+    alert_failed.labels(
+        product=product,
+        channel_type=channel_type,
+        error_type=normalize_error_type(error_type),
+    ).inc()
+    logger.debug(
+        "alert_failed",
+        extra={
+            "product": product,
+            "channel_type": channel_type,
+            "error_type": error_type,
+            "customer_id": customer_id,
+        },
+    )
+
+
+def track_background_job_failed(job_type: str, error_type: str):
+    """
+    Track a failed background job.
+
+    Args:
+        job_type: Job/task name
+        error_type: Error category or exception class name (clamped onto
+            the bounded _ERROR_TYPES label set; raw value is logged)
+    """
+    if not METRICS_ENABLED:
+        return
+    background_job_failed.labels(
+        job_type=job_type, error_type=normalize_error_type(error_type)
+    ).inc()
+    logger.debug(
+        "background_job_failed",
+        extra={"job_type": job_type, "error_type": error_type},
+    )
+
+
+def track_report_generation_failed(report_type: str, error_type: str):
+    """
+    Track a failed report generation.
+
+    Args:
+        report_type: Type of report
+        error_type: Error category or exception class name (clamped onto
+            the bounded _ERROR_TYPES label set; raw value is logged)
+    """
+    if not METRICS_ENABLED:
+        return
+    report_generation_failed.labels(
+        report_type=report_type, error_type=normalize_error_type(error_type)
+    ).inc()
+    logger.debug(
+        "report_generation_failed",
+        extra={"report_type": report_type, "error_type": error_type},
+    )
+
+
+# Ingestion paths may call track_ingestion once per sub-chunk; counts are
+# accumulated per thread and flushed as one lock-guarded inc() per label
+# tuple at request end (or interpreter exit for management commands).
+_ingest_pending = threading.local()
 
 
 def track_ingestion(customer_id: int, record_count: int, status: str = "success"):
     """
     Track claim record ingestion.
 
+    Increments are buffered in a thread-local dict and pushed to the
+    counter by flush_ingestion_metrics, so per-chunk calls don't take the
+    counter lock each time.
+
     Args:
-        customer_id: Customer ID
+        customer_id: Customer ID (hash-bucketed into the customer_bucket label)
         record_count: Number of records ingested
         status: Ingestion status (success, failed, partial)
     """
-    try:
-        claim_records_ingested.labels(customer_id=str(customer_id), status=status).inc(
-            record_count
-        )
-    except Exception as e:
-        logger.warning(f"Failed to track claim_records_ingested metric: {e}")
+    if not METRICS_ENABLED:
+        return
+    pending = getattr(_ingest_pending, "counts", None)
+    if pending is None:
+        pending = _ingest_pending.counts = {}
+    key = (status, customer_bucket(customer_id))
+    pending[key] = pending.get(key, 0) + record_count
+    logger.debug(
+        "claim_records_ingested",
+        extra={
+            "status": status,
+            "record_count": record_count,
+            "customer_id": customer_id,
+        },
+    )
+
+
+def flush_ingestion_metrics(**kwargs):
+    """Push this thread's buffered ingestion counts into the counter."""
+    pending = getattr(_ingest_pending, "counts", None)
+    if not pending:
+        return
+    for (status, bucket), total in pending.items():
+        _claim_records_ingested_child(status, bucket).inc(total)
+    pending.clear()
+
+
+request_finished.connect(
+    flush_ingestion_metrics, dispatch_uid="upstream.metrics.flush_ingestion"
+)
+atexit.register(flush_ingestion_metrics)
@@ -1,34 +1,139 @@
 # Generated migration for HIGH-12: Add unique constraints on hash fields
 # Ensures deduplication works correctly by preventing duplicate hashes
+#
+# Zero-downtime strategy (mirrors migrations 0014/0015):
+# A conditional UniqueConstraint is implemented by the database as a
+# partial unique index. Building that index with plain CREATE UNIQUE
+# INDEX blocks writes for the duration of the build on PostgreSQL, so we
+# build it CONCURRENTLY instead. Partial indexes cannot be promoted via
+# UNIQUE USING INDEX (PostgreSQL only allows that for full indexes), and
+# they don't need to be: the index Django would have created is exactly
+# the one we create here, under the same name, so there is no phase 2.
 
 from django.db import migrations, models
 
 
-class Migration(migrations.Migration):
-    dependencies = [
-        ("upstream", "0004_protect_upload_audit_trail_crit8"),
-    ]
-
-    operations = [
-        # Add unique constraint on Upload.file_hash scoped to customer
+def _unique_constraints():
+    """Constraint declarations, shared by state and non-PostgreSQL paths."""
+    return [
+        # Unique constraint on Upload.file_hash scoped to customer
         # Prevents duplicate file uploads within a customer's scope
-        migrations.AddConstraint(
-            model_name="upload",
-            constraint=models.UniqueConstraint(
+        (
+            "upload",
+            models.UniqueConstraint(
                 fields=["customer", "file_hash"],
                 condition=models.Q(file_hash__isnull=False),
                 name="upload_unique_file_hash_per_customer",
             ),
         ),
-        # Add unique constraint on ClaimRecord.source_data_hash
-        # scoped to customer and upload
+        # Unique constraint on ClaimRecord.source_data_hash scoped to
+        # customer and upload
         # Prevents duplicate row processing within an upload
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.UniqueConstraint(
+        (
+            "claimrecord",
+            models.UniqueConstraint(
                 fields=["customer", "upload", "source_data_hash"],
                 condition=models.Q(source_data_hash__isnull=False),
                 name="claim_unique_source_hash_per_upload",
             ),
         ),
     ]
+
+
+def _drop_index_if_invalid(schema_editor, index_name):
+    """Drop a leftover INVALID index from a failed CONCURRENTLY build.
+
+    With atomic = False a crashed CREATE INDEX CONCURRENTLY is not
+    rolled back: it leaves the index behind marked INVALID, where it
+    enforces nothing but still claims the name. IF NOT EXISTS alone
+    would then skip the rebuild on retry and the constraint would never
+    be enforced, so sweep the invalid leftover first. Checked from
+    Python because DROP INDEX CONCURRENTLY cannot run inside a DO block.
+    """
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT 1
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = %s AND NOT i.indisvalid;
+            """,
+            [index_name],
+        )
+        invalid = cursor.fetchone() is not None
+    if invalid:
+        schema_editor.execute(
+            f"DROP INDEX CONCURRENTLY IF EXISTS {index_name};"
+        )
+
+
+def create_unique_indexes(apps, schema_editor):
+    """Create the partial unique indexes with database-specific SQL."""
+    if schema_editor.connection.vendor == "postgresql":
+        # PostgreSQL: Use CONCURRENTLY for zero-downtime. IF NOT EXISTS
+        # plus the invalid-leftover sweep makes a retry safe after a
+        # failed run (atomic = False means nothing was rolled back).
+        _drop_index_if_invalid(schema_editor, "upload_unique_file_hash_per_customer")
+        schema_editor.execute(
+            """
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS upload_unique_file_hash_per_customer
+            ON upstream_upload (customer_id, file_hash)
+            WHERE file_hash IS NOT NULL;
+        """
+        )
+        _drop_index_if_invalid(schema_editor, "claim_unique_source_hash_per_upload")
+        schema_editor.execute(
+            """
+            CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS claim_unique_source_hash_per_upload
+            ON upstream_claimrecord (customer_id, upload_id, source_data_hash)
+            WHERE source_data_hash IS NOT NULL;
+        """
+        )
+    else:
+        # SQLite/other databases: conditional unique constraints go through
+        # the ordinary DDL path (a partial unique index, no table rebuild)
+        for model_name, constraint in _unique_constraints():
+            model = apps.get_model("upstream", model_name)
+            schema_editor.add_constraint(model, constraint)
+
+
+def drop_unique_indexes(apps, schema_editor):
+    """Drop the partial unique indexes with database-specific SQL."""
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS upload_unique_file_hash_per_customer;"
+        )
+        schema_editor.execute(
+            "DROP INDEX CONCURRENTLY IF EXISTS claim_unique_source_hash_per_upload;"
+        )
+    else:
+        for model_name, constraint in _unique_constraints():
+            model = apps.get_model("upstream", model_name)
+            schema_editor.remove_constraint(model, constraint)
+
+
+class Migration(migrations.Migration):
+    """
+    Zero-downtime migration: Creates partial unique indexes concurrently.
+
+    IMPORTANT: atomic = False is required for CONCURRENTLY operations.
+    PostgreSQL cannot run CREATE INDEX CONCURRENTLY inside a transaction.
+    """
+
+    atomic = False  # Required for CONCURRENTLY operations
+
+    dependencies = [
+        ("upstream", "0004_protect_upload_audit_trail_crit8"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(model_name=model_name, constraint=constraint)
+                for model_name, constraint in _unique_constraints()
+            ],
+            database_operations=[
+                migrations.RunPython(create_unique_indexes, drop_unique_indexes),
+            ],
+        ),
+    ]
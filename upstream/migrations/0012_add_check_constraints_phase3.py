@@ -17,61 +17,68 @@
 # 3. Positive procedure counts
 # 4. Valid date ranges (date_min <= date_max)
 # 5. Row count consistency (accepted + rejected = total)
+#
+# Zero-downtime strategy (mirrors migrations 0014/0015):
+# On PostgreSQL, each AddConstraint would take ACCESS EXCLUSIVE and scan
+# the full table to validate — roughly twenty lock+scan cycles. Instead we
+# issue ONE multi-clause ALTER TABLE per table with NOT VALID (brief lock,
+# no scan), then VALIDATE CONSTRAINT separately, which only takes
+# SHARE UPDATE EXCLUSIVE and does not block writes. Django's model state
+# still sees the plain AddConstraint declarations via
+# SeparateDatabaseAndState. Other databases fall back to the ordinary
+# schema-editor path.
 
 from django.db import migrations, models
 
 
-class Migration(migrations.Migration):
-    dependencies = [
-        ("upstream", "0011_add_covering_indexes_phase3"),
-    ]
-
-    operations = [
+def _check_constraints():
+    """Constraint declarations, shared by state and non-PostgreSQL paths."""
+    return [
         # =====================================================================
         # ClaimRecord constraints
         # =====================================================================
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.CheckConstraint(
+        (
+            "claimrecord",
+            models.CheckConstraint(
                 check=models.Q(data_quality_score__gte=0.0)
                 & models.Q(data_quality_score__lte=1.0)
                 | models.Q(data_quality_score__isnull=True),
                 name="claim_quality_score_range",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.CheckConstraint(
+        (
+            "claimrecord",
+            models.CheckConstraint(
                 check=models.Q(procedure_count__gte=1),
                 name="claim_procedure_count_positive",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.CheckConstraint(
+        (
+            "claimrecord",
+            models.CheckConstraint(
                 check=models.Q(allowed_amount__gte=0)
                 | models.Q(allowed_amount__isnull=True),
                 name="claim_allowed_amount_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.CheckConstraint(
+        (
+            "claimrecord",
+            models.CheckConstraint(
                 check=models.Q(billed_amount__gte=0)
                 | models.Q(billed_amount__isnull=True),
                 name="claim_billed_amount_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.CheckConstraint(
+        (
+            "claimrecord",
+            models.CheckConstraint(
                 check=models.Q(paid_amount__gte=0) | models.Q(paid_amount__isnull=True),
                 name="claim_paid_amount_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="claimrecord",
-            constraint=models.CheckConstraint(
+        (
+            "claimrecord",
+            models.CheckConstraint(
                 check=models.Q(submitted_date__lte=models.F("decided_date")),
                 name="claim_dates_logical_order",
             ),
@@ -79,37 +86,37 @@ class Migration(migrations.Migration):
         # =====================================================================
         # Upload constraints
         # =====================================================================
-        migrations.AddConstraint(
-            model_name="upload",
-            constraint=models.CheckConstraint(
+        (
+            "upload",
+            models.CheckConstraint(
                 check=models.Q(row_count__gte=0) | models.Q(row_count__isnull=True),
                 name="upload_row_count_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="upload",
-            constraint=models.CheckConstraint(
+        (
+            "upload",
+            models.CheckConstraint(
                 check=models.Q(accepted_row_count__gte=0),
                 name="upload_accepted_count_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="upload",
-            constraint=models.CheckConstraint(
+        (
+            "upload",
+            models.CheckConstraint(
                 check=models.Q(rejected_row_count__gte=0),
                 name="upload_rejected_count_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="upload",
-            constraint=models.CheckConstraint(
+        (
+            "upload",
+            models.CheckConstraint(
                 check=models.Q(warning_row_count__gte=0),
                 name="upload_warning_count_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="upload",
-            constraint=models.CheckConstraint(
+        (
+            "upload",
+            models.CheckConstraint(
                 check=models.Q(date_min__lte=models.F("date_max"))
                 | models.Q(date_min__isnull=True)
                 | models.Q(date_max__isnull=True),
@@ -119,62 +126,64 @@ class Migration(migrations.Migration):
         # =====================================================================
         # DataQualityReport constraints
         # =====================================================================
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(total_rows__gte=0), name="dqr_total_rows_nonnegative"
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
-                check=models.Q(accepted_rows__gte=0), name="dqr_accepted_rows_nonnegative"
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
+                check=models.Q(accepted_rows__gte=0),
+                name="dqr_accepted_rows_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
-                check=models.Q(rejected_rows__gte=0), name="dqr_rejected_rows_nonnegative"
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
+                check=models.Q(rejected_rows__gte=0),
+                name="dqr_rejected_rows_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(phi_detections__gte=0),
                 name="dqr_phi_detections_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(missing_fields__gte=0),
                 name="dqr_missing_fields_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(invalid_dates__gte=0),
                 name="dqr_invalid_dates_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(invalid_values__gte=0),
                 name="dqr_invalid_values_nonnegative",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(accepted_rows__lte=models.F("total_rows")),
                 name="dqr_accepted_lte_total",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="dataqualityreport",
-            constraint=models.CheckConstraint(
+        (
+            "dataqualityreport",
+            models.CheckConstraint(
                 check=models.Q(rejected_rows__lte=models.F("total_rows")),
                 name="dqr_rejected_lte_total",
             ),
@@ -182,23 +191,23 @@ class Migration(migrations.Migration):
         # =====================================================================
         # DriftEvent constraints
         # =====================================================================
-        migrations.AddConstraint(
-            model_name="driftevent",
-            constraint=models.CheckConstraint(
+        (
+            "driftevent",
+            models.CheckConstraint(
                 check=models.Q(severity__gte=0.0) & models.Q(severity__lte=1.0),
                 name="drift_severity_range",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="driftevent",
-            constraint=models.CheckConstraint(
+        (
+            "driftevent",
+            models.CheckConstraint(
                 check=models.Q(confidence__gte=0.0) & models.Q(confidence__lte=1.0),
                 name="drift_confidence_range",
             ),
         ),
-        migrations.AddConstraint(
-            model_name="driftevent",
-            constraint=models.CheckConstraint(
+        (
+            "driftevent",
+            models.CheckConstraint(
                 check=models.Q(statistical_significance__gte=0.0)
                 & models.Q(statistical_significance__lte=1.0)
                 | models.Q(statistical_significance__isnull=True),
@@ -206,3 +215,136 @@ class Migration(migrations.Migration):
             ),
         ),
     ]
+
+
+# Hand-written SQL mirrors of the constraints above, grouped by table so
+# PostgreSQL gets one ALTER TABLE (brief ACCESS EXCLUSIVE, no scan) per
+# table instead of one lock+scan per constraint.
+_POSTGRES_CHECKS = {
+    "upstream_claimrecord": [
+        (
+            "claim_quality_score_range",
+            "(data_quality_score >= 0.0 AND data_quality_score <= 1.0)"
+            " OR data_quality_score IS NULL",
+        ),
+        ("claim_procedure_count_positive", "procedure_count >= 1"),
+        (
+            "claim_allowed_amount_nonnegative",
+            "allowed_amount >= 0 OR allowed_amount IS NULL",
+        ),
+        (
+            "claim_billed_amount_nonnegative",
+            "billed_amount >= 0 OR billed_amount IS NULL",
+        ),
+        ("claim_paid_amount_nonnegative", "paid_amount >= 0 OR paid_amount IS NULL"),
+        ("claim_dates_logical_order", "submitted_date <= decided_date"),
+    ],
+    "upstream_upload": [
+        ("upload_row_count_nonnegative", "row_count >= 0 OR row_count IS NULL"),
+        ("upload_accepted_count_nonnegative", "accepted_row_count >= 0"),
+        ("upload_rejected_count_nonnegative", "rejected_row_count >= 0"),
+        ("upload_warning_count_nonnegative", "warning_row_count >= 0"),
+        (
+            "upload_date_range_logical",
+            "date_min <= date_max OR date_min IS NULL OR date_max IS NULL",
+        ),
+    ],
+    "upstream_dataqualityreport": [
+        ("dqr_total_rows_nonnegative", "total_rows >= 0"),
+        ("dqr_accepted_rows_nonnegative", "accepted_rows >= 0"),
+        ("dqr_rejected_rows_nonnegative", "rejected_rows >= 0"),
+        ("dqr_phi_detections_nonnegative", "phi_detections >= 0"),
+        ("dqr_missing_fields_nonnegative", "missing_fields >= 0"),
+        ("dqr_invalid_dates_nonnegative", "invalid_dates >= 0"),
+        ("dqr_invalid_values_nonnegative", "invalid_values >= 0"),
+        ("dqr_accepted_lte_total", "accepted_rows <= total_rows"),
+        ("dqr_rejected_lte_total", "rejected_rows <= total_rows"),
+    ],
+    "upstream_driftevent": [
+        ("drift_severity_range", "severity >= 0.0 AND severity <= 1.0"),
+        ("drift_confidence_range", "confidence >= 0.0 AND confidence <= 1.0"),
+        (
+            "drift_significance_range",
+            "(statistical_significance >= 0.0 AND statistical_significance <= 1.0)"
+            " OR statistical_significance IS NULL",
+        ),
+    ],
+}
+
+
+def add_check_constraints(apps, schema_editor):
+    """Add all CHECK constraints with database-specific SQL."""
+    if schema_editor.connection.vendor == "postgresql":
+        # Phase 1: one multi-clause ALTER per table; NOT VALID skips the
+        # full-table validation scan while the exclusive lock is held.
+        for table, checks in _POSTGRES_CHECKS.items():
+            clauses = ", ".join(
+                f"ADD CONSTRAINT {name} CHECK ({expr}) NOT VALID"
+                for name, expr in checks
+            )
+            schema_editor.execute(f"ALTER TABLE {table} {clauses};")
+
+        # Phase 2: validate existing rows under SHARE UPDATE EXCLUSIVE,
+        # which does not block concurrent writes.
+        for table, checks in _POSTGRES_CHECKS.items():
+            for name, _ in checks:
+                schema_editor.execute(
+                    f"ALTER TABLE {table} VALIDATE CONSTRAINT {name};"
+                )
+    else:
+        # SQLite/other databases: the historical model reflects the state
+        # *before* this migration, so attach the new constraints to its
+        # meta and trigger one table rebuild per model (SQLite remakes the
+        # whole table for CHECK constraints anyway).
+        by_model = {}
+        for model_name, constraint in _check_constraints():
+            by_model.setdefault(model_name, []).append(constraint)
+        for model_name, constraints in by_model.items():
+            model = apps.get_model("upstream", model_name)
+            model._meta.constraints = [*model._meta.constraints, *constraints]
+            schema_editor.add_constraint(model, constraints[-1])
+
+
+def drop_check_constraints(apps, schema_editor):
+    """Drop all CHECK constraints with database-specific SQL."""
+    if schema_editor.connection.vendor == "postgresql":
+        for table, checks in _POSTGRES_CHECKS.items():
+            clauses = ", ".join(
+                f"DROP CONSTRAINT IF EXISTS {name}" for name, _ in checks
+            )
+            schema_editor.execute(f"ALTER TABLE {table} {clauses};")
+    else:
+        by_model = {}
+        for model_name, constraint in _check_constraints():
+            by_model.setdefault(model_name, []).append(constraint)
+        for model_name, constraints in by_model.items():
+            model = apps.get_model("upstream", model_name)
+            dropped = {constraint.name for constraint in constraints}
+            model._meta.constraints = [
+                constraint
+                for constraint in model._meta.constraints
+                if constraint.name not in dropped
+            ]
+            schema_editor.remove_constraint(model, constraints[-1])
+
+
+class Migration(migrations.Migration):
+    # NOT VALID + VALIDATE must not share one long transaction with the
+    # per-table ALTERs, or the lock-reduction is lost.
+    atomic = False
+
+    dependencies = [
+        ("upstream", "0011_add_covering_indexes_phase3"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddConstraint(model_name=model_name, constraint=constraint)
+                for model_name, constraint in _check_constraints()
+            ],
+            database_operations=[
+                migrations.RunPython(add_check_constraints, drop_check_constraints),
+            ],
+        ),
+    ]
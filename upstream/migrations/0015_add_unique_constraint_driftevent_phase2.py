@@ -10,31 +10,60 @@ metadata-only operation that doesn't rebuild the index.
 
 Part of DB-02: Implement unique constraints for data integrity.
 """
-from django.db import migrations, models, connection
+from django.db import migrations, models
 
 
 def add_constraint(apps, schema_editor):
     """Add unique constraint with database-specific SQL."""
-    if connection.vendor == "postgresql":
-        # PostgreSQL: Use existing index to create constraint (fast)
+    if schema_editor.connection.vendor == "postgresql":
+        # Fail fast instead of queueing behind a long-running writer:
+        # ADD CONSTRAINT takes a brief ACCESS EXCLUSIVE lock, and a stuck
+        # acquisition would otherwise block every writer behind it.
+        schema_editor.execute("SET lock_timeout = '5s';")
+        # Idempotency guard: with atomic = False a failed run is not
+        # rolled back, so a retry must tolerate a half-applied state.
+        # Note DROP CONSTRAINT IF EXISTS would NOT be safe here — dropping
+        # a USING INDEX constraint drops its backing index, so a retry
+        # after success would have nothing left to attach to. Skip the
+        # ADD instead when the constraint is already in place.
         schema_editor.execute(
             """
-            ALTER TABLE upstream_driftevent
-            ADD CONSTRAINT driftevent_unique_signal
-            UNIQUE USING INDEX driftevent_signal_uniq_idx;
+            DO $$
+            BEGIN
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_constraint
+                    WHERE conname = 'driftevent_unique_signal'
+                      AND conrelid = 'upstream_driftevent'::regclass
+                ) THEN
+                    -- PostgreSQL: promote the phase-1 index to a
+                    -- constraint (fast, metadata-only)
+                    ALTER TABLE upstream_driftevent
+                    ADD CONSTRAINT driftevent_unique_signal
+                    UNIQUE USING INDEX driftevent_signal_uniq_idx;
+                END IF;
+            END
+            $$;
         """
         )
+        schema_editor.execute("SET lock_timeout = '0';")
     # SQLite: Unique index already enforces uniqueness, no constraint needed
 
 
 def drop_constraint(apps, schema_editor):
     """Drop unique constraint with database-specific SQL."""
-    if connection.vendor == "postgresql":
+    if schema_editor.connection.vendor == "postgresql":
+        # Two separate statements: CREATE INDEX CONCURRENTLY cannot run
+        # inside a transaction, so it must not be chained after the DROP
+        # in one execute() (the chained form only worked by accident when
+        # the migration happened to run in autocommit).
         schema_editor.execute(
             """
             ALTER TABLE upstream_driftevent
             DROP CONSTRAINT IF EXISTS driftevent_unique_signal;
-
+        """
+        )
+        schema_editor.execute(
+            """
             CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS driftevent_signal_uniq_idx
             ON upstream_driftevent (customer_id, report_run_id, payer, cpt_group, drift_type);
         """
@@ -48,8 +77,14 @@ class Migration(migrations.Migration):
 
     Uses SeparateDatabaseAndState to keep Django's model state in sync
     with the actual database schema while using PostgreSQL-specific SQL.
+
+    IMPORTANT: atomic = False so the reverse path's CREATE UNIQUE INDEX
+    CONCURRENTLY is not wrapped in the migration transaction (PostgreSQL
+    forbids CONCURRENTLY inside a transaction block).
     """
 
+    atomic = False  # Required for CONCURRENTLY operations
+
     dependencies = [
         ("upstream", "0014_add_unique_constraint_driftevent_phase1"),
     ]
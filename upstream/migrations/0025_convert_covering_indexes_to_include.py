@@ -0,0 +1,47 @@
+# Convert composite covering indexes to key + INCLUDE
+#
+# claim_analytics_agg_idx and dqr_cust_date_agg_idx (migration 0011) put
+# covering-only columns into the B-tree *key*. Those columns are never
+# filtered or sorted on — they only need to be readable from the leaf
+# page for index-only scans. Moving them to an INCLUDE clause keeps the
+# key narrow (better fanout, fewer pages per scan) and avoids rewriting
+# index entries when a non-key column changes.
+#
+# Migration 0011 predates the project's move to Django 4.2+; INCLUDE is
+# now supported natively. Databases without covering-index support
+# (SQLite) ignore the INCLUDE columns and keep a plain key index.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("upstream", "0024_update_authorization_multi_vertical"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="claimrecord",
+            name="claim_analytics_agg_idx",
+        ),
+        migrations.AddIndex(
+            model_name="claimrecord",
+            index=models.Index(
+                fields=["customer", "decided_date"],
+                include=["payer", "cpt_group", "outcome"],
+                name="claim_analytics_agg_idx",
+            ),
+        ),
+        migrations.RemoveIndex(
+            model_name="dataqualityreport",
+            name="dqr_cust_date_agg_idx",
+        ),
+        migrations.AddIndex(
+            model_name="dataqualityreport",
+            index=models.Index(
+                fields=["customer", "-created_at"],
+                include=["accepted_rows", "total_rows"],
+                name="dqr_cust_date_agg_idx",
+            ),
+        ),
+    ]
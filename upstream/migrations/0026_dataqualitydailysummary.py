@@ -0,0 +1,78 @@
+# Add DataQualityDailySummary rollup table
+#
+# Dashboard scorecards SUM accepted_rows/total_rows over a 30-day window,
+# which scans one DataQualityReport row per upload even with the covering
+# index. The rollup table holds one row per customer per day, maintained
+# incrementally on report creation, so the window scan collapses to at
+# most days-in-window rows. Existing reports are backfilled here.
+
+from django.db import migrations, models
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+import django.db.models.deletion
+
+
+def backfill_daily_summaries(apps, schema_editor):
+    """Roll existing reports up into their customer/day buckets."""
+    DataQualityReport = apps.get_model("upstream", "DataQualityReport")
+    DataQualityDailySummary = apps.get_model("upstream", "DataQualityDailySummary")
+
+    rows = (
+        DataQualityReport.objects.annotate(day=TruncDate("created_at"))
+        .values("customer_id", "day")
+        .annotate(accepted=Sum("accepted_rows"), total=Sum("total_rows"))
+    )
+    DataQualityDailySummary.objects.bulk_create(
+        [
+            DataQualityDailySummary(
+                customer_id=row["customer_id"],
+                day=row["day"],
+                accepted_rows=row["accepted"] or 0,
+                total_rows=row["total"] or 0,
+            )
+            for row in rows
+        ],
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("upstream", "0025_convert_covering_indexes_to_include"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DataQualityDailySummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField()),
+                ("accepted_rows", models.BigIntegerField(default=0)),
+                ("total_rows", models.BigIntegerField(default=0)),
+                (
+                    "customer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="quality_daily_summaries",
+                        to="upstream.customer",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="dataqualitydailysummary",
+            constraint=models.UniqueConstraint(
+                fields=("customer", "day"), name="dqr_daily_summary_uniq"
+            ),
+        ),
+        # Table is dropped on reverse, so no unwind needed for the backfill
+        migrations.RunPython(backfill_daily_summaries, migrations.RunPython.noop),
+    ]
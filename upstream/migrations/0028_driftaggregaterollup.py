@@ -0,0 +1,56 @@
+# Add DriftAggregateRollup table
+#
+# Drift services rescan raw claims for the 90-day baseline on every run
+# even though the window slides by one day. This table keeps one row per
+# (customer, product, bucket_date, dimension_key) with running
+# sum/count/sum-of-squares, so baseline mean/stddev come from a range
+# query over rollup rows. Populated going forward by
+# BaseDriftDetectionService._incremental_update_rollup; there is nothing
+# to backfill because the raw per-day values are not retained elsewhere.
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("upstream", "0027_driftevent_signal_fingerprint"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DriftAggregateRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("product", models.CharField(max_length=50)),
+                ("bucket_date", models.DateField()),
+                ("dimension_key", models.CharField(max_length=255)),
+                ("value_sum", models.FloatField(default=0.0)),
+                ("value_count", models.BigIntegerField(default=0)),
+                ("value_sum_sq", models.FloatField(default=0.0)),
+                (
+                    "customer",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="drift_rollups",
+                        to="upstream.customer",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="driftaggregaterollup",
+            constraint=models.UniqueConstraint(
+                fields=("customer", "product", "bucket_date", "dimension_key"),
+                name="drift_rollup_uniq",
+            ),
+        ),
+    ]
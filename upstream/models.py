@@ -1,6 +1,10 @@
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import receiver
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.conf import settings
+from django.utils import timezone
 from upstream.core.tenant import CustomerScopedManager
 
 
@@ -298,8 +302,11 @@ class DataQualityReport(models.Model):
             ),
             models.Index(fields=["upload"], name="dqr_upload_idx"),
             # Covering index for aggregate queries - uses DataQualityReport.created_at
+            # Aggregated columns ride along via INCLUDE: stored in the leaf
+            # pages for index-only scans without widening the key
             models.Index(
                 fields=["customer", "-created_at"],
+                include=["accepted_rows", "total_rows"],
                 name="dqr_cust_date_agg_idx",
             ),
         ]
@@ -336,6 +343,76 @@ class DataQualityReport(models.Model):
         return summary
 
 
+class DataQualityDailySummary(models.Model):
+    """
+    Daily rollup of DataQualityReport row counts per customer.
+
+    Dashboard aggregates (SUM over a date window) read this table instead
+    of scanning one DataQualityReport row per upload: O(days-in-window)
+    rows rather than O(reports-in-window). Maintained incrementally by a
+    post_save hook whenever a report is created; existing reports were
+    backfilled by migration 0026.
+    """
+
+    customer = models.ForeignKey(
+        Customer, on_delete=models.CASCADE, related_name="quality_daily_summaries"
+    )
+    day = models.DateField()
+    accepted_rows = models.BigIntegerField(default=0)
+    total_rows = models.BigIntegerField(default=0)
+
+    # Tenant isolation
+    objects = CustomerScopedManager()
+    all_objects = models.Manager()  # Unfiltered access for superusers
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["customer", "day"], name="dqr_daily_summary_uniq"
+            ),
+        ]
+
+    def __str__(self):
+        return f"Quality summary {self.day}: {self.accepted_rows}/{self.total_rows}"
+
+    @classmethod
+    def record(cls, report):
+        """Fold one freshly created report into its customer/day bucket."""
+        day = timezone.localdate(report.created_at)
+        bucket = cls.all_objects.filter(customer_id=report.customer_id, day=day)
+        rolled = bucket.update(
+            accepted_rows=F("accepted_rows") + report.accepted_rows,
+            total_rows=F("total_rows") + report.total_rows,
+        )
+        if rolled:
+            return
+        try:
+            with transaction.atomic():
+                cls.all_objects.create(
+                    customer_id=report.customer_id,
+                    day=day,
+                    accepted_rows=report.accepted_rows,
+                    total_rows=report.total_rows,
+                )
+        except IntegrityError:
+            # Lost the insert race to a concurrent upload; the bucket
+            # exists now, so fold into it
+            bucket.update(
+                accepted_rows=F("accepted_rows") + report.accepted_rows,
+                total_rows=F("total_rows") + report.total_rows,
+            )
+
+
+@receiver(
+    post_save,
+    sender=DataQualityReport,
+    dispatch_uid="upstream.models.dqr_daily_summary",
+)
+def _record_quality_report_in_daily_summary(sender, instance, created, **kwargs):
+    if created:
+        DataQualityDailySummary.record(instance)
+
+
 class ClaimRecord(models.Model):
     OUTCOME_CHOICES = [
         ("PAID", "Paid"),
@@ -539,8 +616,12 @@ class ClaimRecord(models.Model):
                 name="claim_auth_idx",
             ),
             # Covering indexes for aggregate queries (Phase 3 Task #2)
+            # Only customer/decided_date are filtered on; payer, cpt_group
+            # and outcome are covering-only, so they live in INCLUDE where
+            # they don't bloat the key or get re-sorted on update
             models.Index(
-                fields=["customer", "decided_date", "payer", "cpt_group", "outcome"],
+                fields=["customer", "decided_date"],
+                include=["payer", "cpt_group", "outcome"],
                 name="claim_analytics_agg_idx",
             ),
             models.Index(
@@ -865,6 +946,126 @@ class DriftEvent(models.Model):
             return "Low"
 
 
+class DriftAggregateRollup(models.Model):
+    """
+    Pre-aggregated daily rollup feeding drift baseline statistics.
+
+    Drift services recompute 90-day baseline aggregates on every run
+    even though the window only slides by one day. This table holds one
+    row per (customer, product, bucket_date, dimension_key) with running
+    sum/count/sum-of-squares, so baseline mean and stddev come from a
+    single range query over at most days-in-window rows per dimension
+    instead of a rescan of raw claims. Maintained via fold_day (called
+    by DriftWatch's processing-time scan and by
+    BaseDriftDetectionService._incremental_update_rollup); day buckets
+    are written with replacement semantics so recomputing a day is
+    idempotent.
+    """
+
+    customer = models.ForeignKey(
+        Customer, on_delete=models.CASCADE, related_name="drift_rollups"
+    )
+    product = models.CharField(max_length=50)
+    bucket_date = models.DateField()
+    # Product-specific dimension, e.g. "payer|cpt_group"
+    dimension_key = models.CharField(max_length=255)
+    value_sum = models.FloatField(default=0.0)
+    value_count = models.BigIntegerField(default=0)
+    value_sum_sq = models.FloatField(default=0.0)
+
+    # Tenant isolation
+    objects = CustomerScopedManager()
+    all_objects = models.Manager()  # Unfiltered access for superusers
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["customer", "product", "bucket_date", "dimension_key"],
+                name="drift_rollup_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f"Rollup {self.product}/{self.dimension_key} "
+            f"{self.bucket_date}: n={self.value_count}"
+        )
+
+    @classmethod
+    def fold_day(cls, customer, product, bucket_date, observations):
+        """
+        Write one day's observations, one row per dimension key.
+
+        observations maps dimension_key (e.g. "payer|cpt_group") to the
+        list of values observed that day. Buckets are upserted on the
+        unique key with replacement semantics, so recomputing a day is
+        idempotent. Returns the number of rows written.
+        """
+        rows = [
+            cls(
+                customer=customer,
+                product=product,
+                bucket_date=bucket_date,
+                dimension_key=dimension_key,
+                value_sum=sum(values),
+                value_count=len(values),
+                value_sum_sq=sum(v * v for v in values),
+            )
+            for dimension_key, values in observations.items()
+        ]
+        if rows:
+            cls.all_objects.bulk_create(
+                rows,
+                batch_size=1000,
+                update_conflicts=True,
+                update_fields=["value_sum", "value_count", "value_sum_sq"],
+                unique_fields=["customer", "product", "bucket_date", "dimension_key"],
+            )
+        return len(rows)
+
+    @classmethod
+    def baseline_stats(cls, customer, product, start_date, end_date):
+        """
+        Per-dimension mean/stddev over [start_date, end_date).
+
+        One range query over days-in-window rollup rows replaces a
+        rescan of raw claims. Returns a mapping of dimension_key to
+        {"mean", "std_dev", "count"}; dimensions with no observations
+        are omitted, and an empty dict means the window has no rollup
+        coverage yet (callers fall back to scanning raw data).
+        """
+        import math
+
+        rows = (
+            cls.all_objects.filter(
+                customer=customer,
+                product=product,
+                bucket_date__gte=start_date,
+                bucket_date__lt=end_date,
+            )
+            .values("dimension_key")
+            .annotate(
+                total=models.Sum("value_sum"),
+                n=models.Sum("value_count"),
+                total_sq=models.Sum("value_sum_sq"),
+            )
+        )
+
+        stats = {}
+        for row in rows:
+            n = row["n"]
+            if not n:
+                continue
+            mean = row["total"] / n
+            variance = max(row["total_sq"] / n - mean * mean, 0.0)
+            stats[row["dimension_key"]] = {
+                "mean": mean,
+                "std_dev": math.sqrt(variance),
+                "count": n,
+            }
+        return stats
+
+
 class UserProfile(models.Model):
     """User profile linking users to customers with roles."""
 
@@ -1,8 +1,66 @@
 """
 Agent findings models for tracking code quality, security, and compliance issues.
 """
-from django.db import models
+from django.db import connections, models
 from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional: falls back to stdlib json via JSONField
+
+
+class OrjsonJSONField(models.JSONField):
+    """
+    JSONField that serializes/deserializes through orjson when available.
+
+    Agent runs bulk-insert many rows with JSON payloads (operation lists,
+    metadata dicts); orjson dumps/loads them several times faster than
+    stdlib json. Deconstructs as a plain JSONField so swapping it in
+    requires no migration, and behaves identically when orjson is absent.
+    """
+
+    def get_prep_value(self, value):
+        if orjson is None or value is None:
+            return super().get_prep_value(value)
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # Types orjson can't serialize natively go through the
+            # configured encoder
+            return super().get_prep_value(value)
+
+    def from_db_value(self, value, expression, connection):
+        if orjson is None or value is None:
+            return super().from_db_value(value, expression, connection)
+        try:
+            return orjson.loads(value)
+        except (TypeError, ValueError):
+            return super().from_db_value(value, expression, connection)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        return name, 'django.db.models.JSONField', args, kwargs
+
+
+def _created_at_brin(name):
+    """
+    BRIN index on created_at for the append-only finding tables.
+
+    These tables only ever append, so physical order tracks created_at
+    almost perfectly — the ideal BRIN case: a fraction of the B-tree's
+    size and near-zero maintenance per INSERT, while still serving the
+    -created_at range scans. PostgreSQL-only; SQLite (dev/test) has no
+    BRIN, so the index list is empty there. Vendor branching in the
+    model definition is acceptable for these models because they have
+    no migrations and are only created via the schema editor.
+    """
+    if connections['default'].vendor != 'postgresql':
+        return []
+    from django.contrib.postgres.indexes import BrinIndex
+
+    return [BrinIndex(fields=['created_at'], pages_per_range=32, name=name)]
 
 
 class AgentRun(models.Model):
@@ -58,10 +116,132 @@ class AgentRun(models.Model):
             models.Index(fields=['agent_type', '-started_at']),
             models.Index(fields=['status', '-started_at']),
         ]
+        constraints = [
+            # The DB rejects miscounted writes without a Python-side
+            # recount. Not an equality check: findings_count also covers
+            # 'info' findings, which have no dedicated counter.
+            models.CheckConstraint(
+                check=(
+                    models.Q(findings_count__gte=(
+                        models.F('critical_count') + models.F('high_count')
+                        + models.F('medium_count') + models.F('low_count')
+                    ))
+                    & models.Q(findings_count__gte=0)
+                    & models.Q(critical_count__gte=0)
+                    & models.Q(high_count__gte=0)
+                    & models.Q(medium_count__gte=0)
+                    & models.Q(low_count__gte=0)
+                ),
+                name='agentrun_counts_consistent',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.get_agent_type_display()} - {self.started_at}"
 
+    def recompute_counts(self, save=True):
+        """
+        Refresh the severity counters from the stored findings.
+
+        One GROUP BY over the run's findings and (optionally) one UPDATE,
+        instead of incrementing and saving this row once per finding.
+        Callers that still have fields of their own to write can pass
+        save=False and issue a single save() themselves.
+        """
+        counts = dict(
+            self.findings.values_list('severity').annotate(n=models.Count('pk'))
+        )
+        self.findings_count = sum(counts.values())
+        self.critical_count = counts.get('critical', 0)
+        self.high_count = counts.get('high', 0)
+        self.medium_count = counts.get('medium', 0)
+        self.low_count = counts.get('low', 0)
+        if save:
+            self.save(update_fields=[
+                'findings_count',
+                'critical_count',
+                'high_count',
+                'medium_count',
+                'low_count',
+            ])
+
+
+class FindingManager(models.Manager):
+    """Manager adding a bulk-ingest path for agent run imports."""
+
+    def bulk_create(self, objs, **kwargs):
+        # bulk_create bypasses save(), so the denormalized rank is
+        # filled here to keep it consistent on every insert path
+        for obj in objs:
+            obj.severity_rank = self.model.SEVERITY_RANK.get(
+                obj.severity, self.model.SEVERITY_RANK['medium']
+            )
+        return super().bulk_create(objs, **kwargs)
+
+    # Secondary composite indexes that only serve read paths; deferred
+    # around large ingests so the load pays one index rebuild instead of
+    # a random B-tree update per row
+    DEFERRABLE_INDEXES = ('finding_status_created_inc', 'finding_category_sev_idx')
+
+    # Below this row count the two index rebuilds cost more than the
+    # per-row maintenance they save
+    BULK_INGEST_DEFER_THRESHOLD = 1000
+
+    def acknowledge(self, pk, user):
+        """
+        Mark a finding acknowledged with one narrow UPDATE.
+
+        A model save() would rewrite every column — including
+        re-serializing the metadata JSON — to change three fields;
+        QuerySet.update writes exactly status, acknowledged_by and
+        acknowledged_at. Returns the number of rows updated (0 if the
+        finding does not exist).
+        """
+        return self.filter(pk=pk).update(
+            status='acknowledged',
+            acknowledged_by=user,
+            acknowledged_at=timezone.now(),
+        )
+
+    def bulk_ingest(self, findings, batch_size=500):
+        """
+        Insert a large batch of findings, deferring secondary indexes.
+
+        On PostgreSQL, drops the read-path composite indexes, bulk-inserts,
+        then rebuilds them CONCURRENTLY, so the insert only maintains the
+        primary key, FK index and unique constraint. Falls back to a plain
+        bulk_create for small batches, non-PostgreSQL backends, or when
+        called inside a transaction (CONCURRENTLY cannot run there).
+        """
+        connection = connections[self.db]
+        deferrable = [
+            index
+            for index in self.model._meta.indexes
+            if index.name in self.DEFERRABLE_INDEXES
+        ]
+        if (
+            connection.vendor != 'postgresql'
+            or connection.in_atomic_block
+            or len(findings) < self.BULK_INGEST_DEFER_THRESHOLD
+        ):
+            return self.bulk_create(
+                findings, batch_size=batch_size, ignore_conflicts=True
+            )
+
+        with connection.schema_editor(atomic=False) as schema_editor:
+            for index in deferrable:
+                schema_editor.remove_index(self.model, index, concurrently=True)
+        try:
+            return self.bulk_create(
+                findings, batch_size=batch_size, ignore_conflicts=True
+            )
+        finally:
+            # Rebuild even if the insert failed partway; CONCURRENTLY
+            # keeps readers unblocked during the rebuild
+            with connection.schema_editor(atomic=False) as schema_editor:
+                for index in deferrable:
+                    schema_editor.add_index(self.model, index, concurrently=True)
+
 
 class Finding(models.Model):
     """Individual finding from an agent run"""
@@ -80,12 +260,19 @@ class Finding(models.Model):
         ('ignored', 'Ignored'),
     ]
 
+    # Numeric ordering for severity: CharField B-tree keys are up to 20
+    # bytes and sort lexicographically (critical < high < info < low <
+    # medium — wrong), so indexes and ORDER BY use this 2-byte rank
+    SEVERITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3, 'info': 4}
+
     agent_run = models.ForeignKey(
         AgentRun,
         on_delete=models.CASCADE,
         related_name='findings'
     )
     severity = models.CharField(max_length=20, choices=SEVERITY_LEVELS)
+    # Denormalized from severity; maintained by save()/bulk_create
+    severity_rank = models.PositiveSmallIntegerField(default=2, editable=False)
     category = models.CharField(max_length=100)
     title = models.CharField(max_length=500)
     description = models.TextField()
@@ -94,7 +281,7 @@ class Finding(models.Model):
     code_snippet = models.TextField(blank=True)
     recommendation = models.TextField(blank=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='open')
-    metadata = models.JSONField(default=dict)
+    metadata = OrjsonJSONField(default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     acknowledged_by = models.ForeignKey(
@@ -106,15 +293,43 @@ class Finding(models.Model):
     )
     acknowledged_at = models.DateTimeField(null=True, blank=True)
 
+    objects = FindingManager()
+
     class Meta:
         db_table = 'upstream_finding'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['agent_run', 'severity']),
-            models.Index(fields=['status', '-created_at']),
-            models.Index(fields=['category', 'severity']),
+            models.Index(fields=['agent_run', 'severity_rank'], name='finding_run_sevrank_idx'),
+            # Covering index for the finding list views: filter on status,
+            # paginate by -created_at, and render severity/title/category
+            # straight off the index (index-only scan on PostgreSQL; the
+            # INCLUDE columns are ignored on SQLite)
+            models.Index(
+                fields=['status', '-created_at'],
+                include=['severity', 'title', 'category', 'agent_run'],
+                name='finding_status_created_inc',
+            ),
+            # Named so bulk_ingest can defer it around large loads
+            models.Index(fields=['category', 'severity'], name='finding_category_sev_idx'),
+        ] + _created_at_brin('finding_created_brin')
+        constraints = [
+            # Re-running an agent against the same run must not duplicate
+            # findings; pairs with bulk_create(ignore_conflicts=True)
+            models.UniqueConstraint(
+                fields=['agent_run', 'category', 'title'],
+                name='uniq_finding_per_run_cat_title',
+            ),
         ]
 
+    def save(self, *args, **kwargs):
+        self.severity_rank = self.SEVERITY_RANK.get(
+            self.severity, self.SEVERITY_RANK['medium']
+        )
+        if (update_fields := kwargs.get('update_fields')) is not None:
+            if 'severity' in update_fields and 'severity_rank' not in update_fields:
+                kwargs['update_fields'] = [*update_fields, 'severity_rank']
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"[{self.severity.upper()}] {self.title}"
 
@@ -130,7 +345,7 @@ class CodeQualityMetric(models.Model):
     metric_value = models.FloatField()
     threshold = models.FloatField(null=True, blank=True)
     passed = models.BooleanField(default=True)
-    details = models.JSONField(default=dict)
+    details = OrjsonJSONField(default=dict)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -138,7 +353,7 @@ class CodeQualityMetric(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['metric_name', '-created_at']),
-        ]
+        ] + _created_at_brin('cqmetric_created_brin')
 
     def __str__(self):
         return f"{self.metric_name}: {self.metric_value}"
@@ -178,6 +393,13 @@ class DatabaseQueryAnalysis(models.Model):
     class Meta:
         db_table = 'upstream_db_query_analysis'
         ordering = ['-created_at']
+        indexes = _created_at_brin('queryanalysis_created_brin')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['agent_run', 'file_path', 'line_number', 'issue_type'],
+                name='uniq_query_analysis_per_run_location',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.issue_type} in {self.file_path}:{self.line_number}"
@@ -194,13 +416,17 @@ class TestCoverageReport(models.Model):
     total_lines = models.IntegerField()
     covered_lines = models.IntegerField()
     coverage_percentage = models.FloatField()
-    missing_lines = models.JSONField(default=list)  # List of line numbers
-    untested_functions = models.JSONField(default=list)
+    # List of line numbers. Deliberately not a postgres ArrayField: these
+    # models must load on SQLite (dev/test), and OrjsonJSONField already
+    # decodes large integer lists in C rather than via stdlib json.
+    missing_lines = OrjsonJSONField(default=list)
+    untested_functions = OrjsonJSONField(default=list)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
         db_table = 'upstream_test_coverage_report'
         ordering = ['coverage_percentage']
+        indexes = _created_at_brin('coverage_created_brin')
 
     def __str__(self):
         return f"{self.file_path}: {self.coverage_percentage:.1f}%"
@@ -223,8 +449,8 @@ class MigrationAnalysis(models.Model):
             ('destructive', 'Destructive'),
         ]
     )
-    operations = models.JSONField(default=list)
-    potential_issues = models.JSONField(default=list)
+    operations = OrjsonJSONField(default=list)
+    potential_issues = OrjsonJSONField(default=list)
     rollback_possible = models.BooleanField(default=True)
     estimated_duration = models.CharField(max_length=100, blank=True)
     recommendations = models.TextField(blank=True)
@@ -233,6 +459,13 @@ class MigrationAnalysis(models.Model):
     class Meta:
         db_table = 'upstream_migration_analysis'
         ordering = ['-created_at']
+        indexes = _created_at_brin('miganalysis_created_brin')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['agent_run', 'migration_file'],
+                name='uniq_migration_analysis_per_run_file',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.migration_file}: {self.risk_level}"
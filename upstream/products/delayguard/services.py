@@ -880,9 +880,7 @@ class DelayGuardComputationService:
         )
 
         # Track payment delay signal metric
-        payment_delay_signal_created.labels(
-            severity=severity, customer_id=str(self.customer.id)
-        ).inc()
+        payment_delay_signal_created.labels(severity=severity).inc()
 
         if aggregates:
             signal.related_aggregates.add(*aggregates)
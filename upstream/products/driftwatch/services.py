@@ -13,6 +13,7 @@ Each signal includes statistical confidence scoring, baseline comparison,
 and actionable intelligence for revenue recovery.
 """
 
+from collections import defaultdict
 from datetime import timedelta
 from decimal import Decimal
 from django.db import transaction
@@ -21,9 +22,10 @@ from django.utils import timezone
 import numpy as np
 from typing import Dict, List, Tuple
 
-from upstream.models import ClaimRecord, DriftEvent, ReportRun
+from upstream.models import ClaimRecord, DriftAggregateRollup, DriftEvent, ReportRun
 from upstream.ingestion.services import publish_event
 from upstream.metrics import track_drift_event
+from upstream.services.base_drift_detection import BaseDriftDetectionService
 from upstream.constants import (
     PROCESSING_TIME_DRIFT_THRESHOLD_DAYS,
     PROCESSING_TIME_DRIFT_NORMALIZATION_DIVISOR,
@@ -128,6 +130,27 @@ class DriftWatchSignalService:
 
         return results
 
+    def _persist_signals(
+        self, signals: List[DriftEvent], event_title: str
+    ) -> List[DriftEvent]:
+        """
+        Bulk-insert detected signals, then emit metrics and events.
+
+        One INSERT per detector instead of one per signal; duplicate
+        signals (same fingerprint as an existing row) are skipped by
+        the unique constraint rather than aborting the whole run.
+        """
+        BaseDriftDetectionService._bulk_save(DriftEvent, signals)
+        for signal in signals:
+            track_drift_event(
+                product="DriftWatch",
+                drift_type=signal.drift_type,
+                severity=float(signal.severity),
+                customer_id=self.customer.id,
+            )
+            self._publish_drift_event(signal, event_title)
+        return signals
+
     def detect_denial_rate_drift(
         self, report_run, baseline_start, baseline_end, current_start, current_end
     ) -> List[DriftEvent]:
@@ -173,7 +196,7 @@ class DriftWatchSignalService:
                 avg_allowed = current_data["avg_allowed"] or Decimal("0")
                 estimated_impact = float(delta * current_data["total"] * avg_allowed)
 
-                signal = DriftEvent.objects.create(
+                signal = DriftEvent(
                     customer=self.customer,
                     report_run=report_run,
                     payer=payer,
@@ -201,20 +224,9 @@ class DriftWatchSignalService:
                     ],
                 )
 
-                # Track drift event metric
-                track_drift_event(
-                    product="DriftWatch",
-                    drift_type="DENIAL_RATE",
-                    severity=float(severity),
-                    customer_id=self.customer.id,
-                )
-
                 signals.append(signal)
 
-                # Publish event
-                self._publish_drift_event(signal, "Denial Rate Drift")
-
-        return signals
+        return self._persist_signals(signals, "Denial Rate Drift")
 
     def detect_underpayment_variance(
         self, report_run, baseline_start, baseline_end, current_start, current_end
@@ -268,7 +280,7 @@ class DriftWatchSignalService:
 
                 severity = self._calculate_severity(variance, 0.05)
 
-                signal = DriftEvent.objects.create(
+                signal = DriftEvent(
                     customer=self.customer,
                     report_run=report_run,
                     payer=payer,
@@ -295,18 +307,9 @@ class DriftWatchSignalService:
                     ],
                 )
 
-                # Track drift event metric
-                track_drift_event(
-                    product="DriftWatch",
-                    drift_type="PAYMENT_AMOUNT",
-                    severity=float(severity),
-                    customer_id=self.customer.id,
-                )
-
                 signals.append(signal)
-                self._publish_drift_event(signal, "Underpayment Variance")
 
-        return signals
+        return self._persist_signals(signals, "Underpayment Variance")
 
     def detect_payment_delay(
         self, report_run, baseline_start, baseline_end, current_start, current_end
@@ -354,7 +357,7 @@ class DriftWatchSignalService:
                     (delta_days / 365) * avg_payment * current_data["count"]
                 )
 
-                signal = DriftEvent.objects.create(
+                signal = DriftEvent(
                     customer=self.customer,
                     report_run=report_run,
                     payer=payer,
@@ -381,18 +384,9 @@ class DriftWatchSignalService:
                     ],
                 )
 
-                # Track drift event metric
-                track_drift_event(
-                    product="DriftWatch",
-                    drift_type="PROCESSING_DELAY",
-                    severity=float(severity),
-                    customer_id=self.customer.id,
-                )
-
                 signals.append(signal)
-                self._publish_drift_event(signal, "Payment Delay")
 
-        return signals
+        return self._persist_signals(signals, "Payment Delay")
 
     def detect_auth_failure_spike(
         self, report_run, baseline_start, baseline_end, current_start, current_end
@@ -435,7 +429,7 @@ class DriftWatchSignalService:
                 avg_allowed = current_data.get("avg_allowed", Decimal("0"))
                 impact = float(current_data["auth_failures"] * avg_allowed)
 
-                signal = DriftEvent.objects.create(
+                signal = DriftEvent(
                     customer=self.customer,
                     report_run=report_run,
                     payer=payer,
@@ -462,18 +456,9 @@ class DriftWatchSignalService:
                     ],
                 )
 
-                # Track drift event metric
-                track_drift_event(
-                    product="DriftWatch",
-                    drift_type="AUTH_FAILURE_RATE",
-                    severity=float(severity),
-                    customer_id=self.customer.id,
-                )
-
                 signals.append(signal)
-                self._publish_drift_event(signal, "Authorization Failure Spike")
 
-        return signals
+        return self._persist_signals(signals, "Authorization Failure Spike")
 
     def detect_approval_rate_decline(
         self, report_run, baseline_start, baseline_end, current_start, current_end
@@ -513,7 +498,7 @@ class DriftWatchSignalService:
 
                 severity = self._calculate_severity(delta, 0.05)
 
-                signal = DriftEvent.objects.create(
+                signal = DriftEvent(
                     customer=self.customer,
                     report_run=report_run,
                     payer=payer,
@@ -534,18 +519,9 @@ class DriftWatchSignalService:
                     trend_direction="degrading",
                 )
 
-                # Track drift event metric
-                track_drift_event(
-                    product="DriftWatch",
-                    drift_type="APPROVAL_RATE",
-                    severity=float(severity),
-                    customer_id=self.customer.id,
-                )
-
                 signals.append(signal)
-                self._publish_drift_event(signal, "Approval Rate Decline")
 
-        return signals
+        return self._persist_signals(signals, "Approval Rate Decline")
 
     def detect_processing_time_drift(
         self, report_run, baseline_start, baseline_end, current_start, current_end
@@ -553,8 +529,22 @@ class DriftWatchSignalService:
         """Detect changes in claim adjudication time (submitted to decided)."""
         signals = []
 
-        baseline_stats = self._get_processing_time_stats(baseline_start, baseline_end)
-        current_stats = self._get_processing_time_stats(current_start, current_end)
+        # Baseline comes from the DriftAggregateRollup table once it
+        # covers the window: one range query over day buckets instead of
+        # rescanning 90 days of raw claims every run. The first run (or
+        # an empty rollup) falls back to the raw scan, which also seeds
+        # the rollup; current-window scans keep folding new days in, so
+        # coverage accumulates as the window slides.
+        baseline_stats = self._get_rollup_processing_time_stats(
+            baseline_start, baseline_end
+        )
+        if not baseline_stats:
+            baseline_stats = self._get_processing_time_stats(
+                baseline_start, baseline_end, fold_rollup=True
+            )
+        current_stats = self._get_processing_time_stats(
+            current_start, current_end, fold_rollup=True
+        )
 
         for key, current_data in current_stats.items():
             payer, cpt_group = key
@@ -587,7 +577,7 @@ class DriftWatchSignalService:
                     PROCESSING_TIME_DRIFT_SEVERITY_THRESHOLD,
                 )
 
-                signal = DriftEvent.objects.create(
+                signal = DriftEvent(
                     customer=self.customer,
                     report_run=report_run,
                     payer=payer,
@@ -608,18 +598,9 @@ class DriftWatchSignalService:
                     trend_direction="degrading",
                 )
 
-                # Track drift event metric
-                track_drift_event(
-                    product="DriftWatch",
-                    drift_type="DECISION_TIME",
-                    severity=float(severity),
-                    customer_id=self.customer.id,
-                )
-
                 signals.append(signal)
-                self._publish_drift_event(signal, "Processing Time Drift")
 
-        return signals
+        return self._persist_signals(signals, "Processing Time Drift")
 
     # === Helper Methods: Stats Aggregation ===
 
@@ -798,35 +779,45 @@ class DriftWatchSignalService:
 
         return stats
 
-    def _get_processing_time_stats(self, start_date, end_date) -> Dict:
-        """Get claim processing time statistics."""
-        stats = {}
+    def _get_processing_time_stats(
+        self, start_date, end_date, fold_rollup=False
+    ) -> Dict:
+        """
+        Get claim processing time statistics from raw claims.
+
+        Single pass over the window grouping days-to-decision in memory.
+        When fold_rollup is True, each scanned day is also folded into
+        DriftAggregateRollup (keyed "payer|cpt_group") so later baseline
+        reads can come from _get_rollup_processing_time_stats instead of
+        rescanning claims.
+        """
+        days_by_key = defaultdict(list)
+        daily_observations = defaultdict(lambda: defaultdict(list))
 
         claims = ClaimRecord.objects.filter(
             customer=self.customer,
             decided_date__gte=start_date,
             decided_date__lt=end_date,
-        ).values("payer", "cpt_group")
-
-        for row in claims.iterator():
-            key = (row["payer"], row["cpt_group"])
-
-            # Get days to decision for this group
-            claim_subset = ClaimRecord.objects.filter(
-                customer=self.customer,
-                payer=row["payer"],
-                cpt_group=row["cpt_group"],
-                decided_date__gte=start_date,
-                decided_date__lt=end_date,
-            )
+            submitted_date__isnull=False,
+        ).values_list("payer", "cpt_group", "submitted_date", "decided_date")
+
+        for payer, cpt_group, submitted_date, decided_date in claims.iterator():
+            days = (decided_date - submitted_date).days
+            days_by_key[(payer, cpt_group)].append(days)
+            if fold_rollup:
+                daily_observations[decided_date][f"{payer}|{cpt_group}"].append(
+                    float(days)
+                )
 
-            days_list = []
-            for claim in claim_subset:
-                if claim.submitted_date and claim.decided_date:
-                    days = (claim.decided_date - claim.submitted_date).days
-                    days_list.append(days)
+        if fold_rollup:
+            for bucket_date, observations in daily_observations.items():
+                DriftAggregateRollup.fold_day(
+                    self.customer, "DriftWatch", bucket_date, observations
+                )
 
-            if days_list and len(days_list) >= self.MIN_SAMPLE_SIZE:
+        stats = {}
+        for key, days_list in days_by_key.items():
+            if len(days_list) >= self.MIN_SAMPLE_SIZE:
                 stats[key] = {
                     "count": len(days_list),
                     "avg_days": np.mean(days_list),
@@ -835,6 +826,32 @@ class DriftWatchSignalService:
 
         return stats
 
+    def _get_rollup_processing_time_stats(self, start_date, end_date) -> Dict:
+        """
+        Read processing time statistics back from DriftAggregateRollup.
+
+        Returns the same shape as _get_processing_time_stats (keyed by
+        (payer, cpt_group), MIN_SAMPLE_SIZE applied); an empty dict
+        means the rollup has no coverage for the window yet and the
+        caller should fall back to scanning raw claims.
+        """
+        rollup = DriftAggregateRollup.baseline_stats(
+            self.customer, "DriftWatch", start_date, end_date
+        )
+
+        stats = {}
+        for dimension_key, row in rollup.items():
+            if row["count"] < self.MIN_SAMPLE_SIZE:
+                continue
+            payer, _, cpt_group = dimension_key.partition("|")
+            stats[(payer, cpt_group)] = {
+                "count": row["count"],
+                "avg_days": row["mean"],
+                "std_dev": row["std_dev"],
+            }
+
+        return stats
+
     # === Helper Methods: Statistics ===
 
     def _calculate_proportion_confidence(
@@ -20,11 +20,13 @@ from upstream.models import (
     ClaimRecord,
     Upload,
     UserProfile,
+    DriftAggregateRollup,
     DriftEvent,
     ReportRun,
 )
 from upstream.services.payer_drift import compute_weekly_payer_drift
 from upstream.products.driftwatch import DRIFTWATCH_V1_EVENT_TYPE
+from upstream.products.driftwatch.services import DriftWatchSignalService
 
 
 class DriftWatchTests(TestCase):
@@ -201,3 +203,111 @@ class DriftWatchTests(TestCase):
                 1,
                 f"Expected at least 1 demo DriftEvent, got {demo_events.count()}",
             )
+
+
+class DriftWatchProcessingTimeRollupTests(TestCase):
+    """Processing time baselines flow through DriftAggregateRollup."""
+
+    def setUp(self):
+        self.customer = Customer.objects.create(name="Rollup Wiring Customer")
+        self.upload = Upload.all_objects.create(
+            customer=self.customer, filename="rollup_claims.csv", status="success"
+        )
+        self.service = DriftWatchSignalService(self.customer)
+        self.today = timezone.now().date()
+
+    def _create_claim(self, payer, cpt_group, decided_days_ago, processing_days):
+        decided_date = self.today - timedelta(days=decided_days_ago)
+        return ClaimRecord.all_objects.create(
+            customer=self.customer,
+            upload=self.upload,
+            payer=payer,
+            cpt="99213",
+            cpt_group=cpt_group,
+            submitted_date=decided_date - timedelta(days=processing_days),
+            decided_date=decided_date,
+            outcome="PAID",
+            allowed_amount=Decimal("100"),
+        )
+
+    def test_scan_seeds_rollup_and_reads_back_identical_stats(self):
+        """A fold_rollup scan populates the rollup, and the rollup read
+        path reproduces the raw-scan stats exactly."""
+        for i in range(25):
+            self._create_claim("Aetna", "OFFICE", decided_days_ago=1 + i % 10,
+                               processing_days=3 + i % 5)
+
+        start = self.today - timedelta(days=30)
+        with customer_context(self.customer):
+            raw = self.service._get_processing_time_stats(
+                start, self.today, fold_rollup=True
+            )
+
+        self.assertIn(("Aetna", "OFFICE"), raw)
+        self.assertTrue(
+            DriftAggregateRollup.all_objects.filter(
+                customer=self.customer, product="DriftWatch"
+            ).exists()
+        )
+
+        rolled = self.service._get_rollup_processing_time_stats(start, self.today)
+        self.assertEqual(set(rolled), set(raw))
+        for key, raw_stats in raw.items():
+            self.assertEqual(rolled[key]["count"], raw_stats["count"])
+            self.assertAlmostEqual(rolled[key]["avg_days"], raw_stats["avg_days"])
+            self.assertAlmostEqual(rolled[key]["std_dev"], raw_stats["std_dev"])
+
+    def test_rescanning_same_window_does_not_double_count(self):
+        """Day buckets have replacement semantics, so rerunning a scan
+        over the same window leaves rollup counts unchanged."""
+        for i in range(25):
+            self._create_claim("Aetna", "OFFICE", decided_days_ago=1 + i % 5,
+                               processing_days=4)
+
+        start = self.today - timedelta(days=30)
+        with customer_context(self.customer):
+            self.service._get_processing_time_stats(start, self.today, fold_rollup=True)
+            self.service._get_processing_time_stats(start, self.today, fold_rollup=True)
+
+        rolled = self.service._get_rollup_processing_time_stats(start, self.today)
+        self.assertEqual(rolled[("Aetna", "OFFICE")]["count"], 25)
+
+    def test_detect_reads_baseline_from_rollup(self):
+        """detect_processing_time_drift uses a populated rollup as its
+        baseline: a signal fires against rollup-only baseline data even
+        though no baseline-window claims exist."""
+        baseline_start = self.today - timedelta(days=104)
+        baseline_end = self.today - timedelta(days=14)
+        current_start = baseline_end
+        current_end = self.today
+
+        # Baseline lives only in the rollup: 30 days x 2 obs of 3-day
+        # processing, no ClaimRecord rows in the window
+        for day_offset in range(30):
+            DriftAggregateRollup.fold_day(
+                self.customer,
+                "DriftWatch",
+                baseline_end - timedelta(days=1 + day_offset),
+                {"Aetna|OFFICE": [3.0, 3.0]},
+            )
+
+        # Current window: real claims with much slower processing
+        for i in range(25):
+            self._create_claim("Aetna", "OFFICE", decided_days_ago=1 + i % 10,
+                               processing_days=15)
+
+        report_run = ReportRun.all_objects.create(
+            customer=self.customer, run_type="weekly", status="success"
+        )
+        with customer_context(self.customer):
+            signals = self.service.detect_processing_time_drift(
+                report_run, baseline_start, baseline_end, current_start, current_end
+            )
+
+            self.assertEqual(len(signals), 1)
+            signal = DriftEvent.objects.get(
+                customer=self.customer, drift_type="DECISION_TIME"
+            )
+        self.assertEqual(signal.baseline_sample_size, 60)
+        self.assertAlmostEqual(signal.baseline_value, 3.0)
+        self.assertAlmostEqual(signal.current_value, 15.0)
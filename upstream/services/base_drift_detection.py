@@ -15,6 +15,7 @@ Related to ARCH-3 (Technical Debt): Drift detection abstraction.
 
 from abc import ABC, abstractmethod
 from datetime import date, timedelta
+from functools import lru_cache
 from decimal import Decimal
 from typing import Dict, Tuple, TypedDict, List, Optional, Any
 from django.db import transaction
@@ -44,6 +45,39 @@ class ComputationResult(TypedDict):
     metadata: Dict[str, Any]
 
 
+@lru_cache(maxsize=4096)
+def _compute_windows_cached(
+    baseline_days: int,
+    current_days: int,
+    start_date: Optional[date],
+    end_date: date,
+) -> Tuple[date, date, date, date]:
+    """
+    Memoized window arithmetic shared by all drift services.
+
+    Batch runs invoke compute() once per customer with identical
+    (baseline_days, current_days, end_date) arguments; caching here
+    avoids re-deriving the same four dates for every customer. All
+    arguments are immutable and hashable, so they key the cache
+    directly. end_date must already be resolved (never None) so that
+    timezone.now() stays outside the cache. Returns a flat
+    (baseline_start, baseline_end, current_start, current_end) tuple
+    rather than TimeWindow dicts so cached entries stay immutable.
+    """
+    if start_date is None:
+        start_date = end_date - timedelta(days=baseline_days + current_days)
+
+    # Current window: most recent period
+    current_end = end_date
+    current_start = max(start_date, current_end - timedelta(days=current_days))
+
+    # Baseline window: comparison period before current
+    baseline_end = current_start
+    baseline_start = max(start_date, baseline_end - timedelta(days=baseline_days))
+
+    return baseline_start, baseline_end, current_start, current_end
+
+
 class BaseDriftDetectionService(ABC):
     """
     Abstract base class for drift detection services.
@@ -182,21 +216,13 @@ class BaseDriftDetectionService(ABC):
         if end_date is None:
             end_date = timezone.now().date()
 
-        if start_date is None:
-            start_date = end_date - timedelta(
-                days=self.DEFAULT_BASELINE_DAYS + self.DEFAULT_CURRENT_DAYS
+        baseline_start, baseline_end, current_start, current_end = (
+            _compute_windows_cached(
+                self.DEFAULT_BASELINE_DAYS,
+                self.DEFAULT_CURRENT_DAYS,
+                start_date,
+                end_date,
             )
-
-        # Current window: most recent period
-        current_end = end_date
-        current_start = max(
-            start_date, current_end - timedelta(days=self.DEFAULT_CURRENT_DAYS)
-        )
-
-        # Baseline window: comparison period before current
-        baseline_end = current_start
-        baseline_start = max(
-            start_date, baseline_end - timedelta(days=self.DEFAULT_BASELINE_DAYS)
         )
 
         baseline_window = TimeWindow(start=baseline_start, end=baseline_end)
@@ -217,7 +243,7 @@ class BaseDriftDetectionService(ABC):
             Percentage change (e.g., 0.15 for 15% increase)
             Returns 0.0 if baseline is 0 or None
         """
-        if not baseline_value or baseline_value == 0:
+        if not baseline_value:
             return 0.0
         return (current_value - baseline_value) / baseline_value
 
@@ -235,7 +261,7 @@ class BaseDriftDetectionService(ABC):
             Z-score (number of standard deviations from mean)
             Returns 0.0 if std_dev is 0 or None
         """
-        if not std_dev or std_dev == 0:
+        if not std_dev:
             return 0.0
         return (value - mean) / std_dev
 
@@ -291,8 +317,155 @@ class BaseDriftDetectionService(ABC):
         z_threshold = 1.96  # For 95% confidence (p < 0.05)
         significance_factor = min(abs(z_score) / z_threshold, 1.0) * 0.5
 
-        confidence = Decimal(str(sample_factor + significance_factor))
-        return min(confidence, Decimal("1.0"))
+        # Stay in float for the math; Decimal only matters at the model
+        # boundary, so coerce exactly once on the way out
+        confidence = min(sample_factor + significance_factor, 1.0)
+        return Decimal(f"{confidence:.6f}")
+
+    @staticmethod
+    def compute_confidence_scores(
+        sample_sizes: List[int],
+        z_scores: List[float],
+        min_sample_size: int = 20,
+        significance_threshold: float = 0.05,
+    ) -> List[Decimal]:
+        """
+        Batch variant of compute_confidence_score for signal candidates.
+
+        Subclass _detect_signals implementations that evaluate many
+        candidates (per day x per payer x per CPT) should prefer this
+        over a per-candidate loop: when numpy is importable the math
+        runs vectorized over the whole batch, otherwise it falls back
+        to the scalar helper.
+
+        Args:
+            sample_sizes: Observation counts, one per candidate
+            z_scores: Z-scores, one per candidate (same length)
+            min_sample_size: Minimum sample size threshold
+            significance_threshold: P-value threshold
+
+        Returns:
+            List of confidence scores (Decimal, 0.0 to 1.0), in order
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            return [
+                BaseDriftDetectionService.compute_confidence_score(
+                    n, z, min_sample_size, significance_threshold
+                )
+                for n, z in zip(sample_sizes, z_scores)
+            ]
+
+        sample_factor = (
+            np.minimum(
+                np.asarray(sample_sizes, dtype=np.float64) / (min_sample_size * 2),
+                1.0,
+            )
+            * 0.5
+        )
+        significance_factor = (
+            np.minimum(np.abs(np.asarray(z_scores, dtype=np.float64)) / 1.96, 1.0)
+            * 0.5
+        )
+        confidence = np.minimum(sample_factor + significance_factor, 1.0)
+        return [Decimal(f"{c:.6f}") for c in confidence]
+
+    def _incremental_update_rollup(
+        self,
+        bucket_date: date,
+        observations: Dict[str, List[float]],
+    ) -> int:
+        """
+        Fold one day's observations into the drift rollup table.
+
+        Call inside the compute() transaction after aggregates are
+        built, passing the values observed on bucket_date grouped by
+        dimension key. Buckets are written with replacement semantics
+        (upsert on the unique key), so recomputing a day is idempotent;
+        the sliding baseline window needs no subtract-oldest step
+        because _baseline_stats range-filters on bucket_date.
+
+        Args:
+            bucket_date: Day the observations belong to
+            observations: Mapping of dimension_key (e.g. "payer|cpt")
+                to the list of values observed that day
+
+        Returns:
+            Number of rollup rows written
+        """
+        from upstream.models import DriftAggregateRollup
+
+        return DriftAggregateRollup.fold_day(
+            self.customer, self._get_product_name(), bucket_date, observations
+        )
+
+    def _baseline_stats(
+        self, baseline_window: TimeWindow
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Read baseline mean/stddev per dimension from the rollup table.
+
+        One range query over days-in-window rollup rows replaces the
+        per-run rescan of raw claims for the 90-day baseline.
+
+        Args:
+            baseline_window: Baseline window from _compute_time_windows
+
+        Returns:
+            Mapping of dimension_key to {"mean", "std_dev", "count"};
+            dimensions with no observations are omitted
+        """
+        from upstream.models import DriftAggregateRollup
+
+        return DriftAggregateRollup.baseline_stats(
+            self.customer,
+            self._get_product_name(),
+            baseline_window["start"],
+            baseline_window["end"],
+        )
+
+    @staticmethod
+    def _bulk_save(
+        model_cls,
+        instances: List[Any],
+        batch_size: int = 1000,
+        update_conflicts: bool = False,
+        update_fields: Optional[List[str]] = None,
+        unique_fields: Optional[List[str]] = None,
+    ) -> List[Any]:
+        """
+        Persist aggregate/signal instances in batched INSERTs.
+
+        Replaces one-INSERT-per-row loops in subclasses: a 90-day run
+        across payers and CPT codes produces thousands of aggregate
+        rows, and per-row save() makes round trips dominate wall time.
+
+        Args:
+            model_cls: Model class of the instances
+            instances: Unsaved model instances to persist
+            batch_size: Rows per INSERT statement
+            update_conflicts: Upsert on conflict instead of skipping
+                (requires update_fields and unique_fields)
+            update_fields: Fields to overwrite on conflict when
+                update_conflicts is True
+            unique_fields: Fields forming the conflict target when
+                update_conflicts is True
+
+        Returns:
+            The list of instances, for use as the method return value
+            (len() keeps the aggregates_created contract)
+        """
+        if instances:
+            model_cls.objects.bulk_create(
+                instances,
+                batch_size=batch_size,
+                ignore_conflicts=not update_conflicts,
+                update_conflicts=update_conflicts,
+                update_fields=update_fields,
+                unique_fields=unique_fields,
+            )
+        return instances
 
     def _publish_computation_event(
         self, signals_created: int, aggregates_created: int
@@ -347,6 +520,9 @@ class BaseDriftDetectionService(ABC):
 
         This method should query ClaimRecord data and create aggregate
         records (e.g., PaymentDelayAggregate, DenialAggregate, etc.).
+        Implementations should build unsaved instances and persist them
+        with _bulk_save() in one batched INSERT rather than calling
+        save() per row, keeping the atomic block in compute() short.
 
         Args:
             start_date: Start date for aggregation (inclusive)
@@ -0,0 +1,95 @@
+"""
+Tests for agent findings models.
+
+The agent models carry no migrations (their tables are created via the
+schema editor by the agent tooling), so the tables are created and
+dropped around each test class here. Importing upstream.models_agents
+registers the models with the app registry, and pytest-django's
+session-scoped database setup serializes every registered model — so
+the import is deferred to setUpClass: at collection time the models
+stay unregistered, and by the time they register, their tables exist.
+"""
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TransactionTestCase
+
+
+class FindingManagerTests(TransactionTestCase):
+    """Tests for FindingManager.bulk_ingest and acknowledge."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from upstream.models_agents import AgentRun, Finding
+
+        cls.AgentRun = AgentRun
+        cls.Finding = Finding
+        with connection.schema_editor() as editor:
+            editor.create_model(AgentRun)
+            editor.create_model(Finding)
+
+    @classmethod
+    def tearDownClass(cls):
+        with connection.schema_editor() as editor:
+            editor.delete_model(cls.Finding)
+            editor.delete_model(cls.AgentRun)
+        super().tearDownClass()
+
+    def setUp(self):
+        self.run = self.AgentRun.objects.create(
+            agent_type="code_quality", trigger="manual"
+        )
+
+    def _finding(self, title, severity="high"):
+        return self.Finding(
+            agent_run=self.run,
+            severity=severity,
+            category="performance",
+            title=title,
+            description="test finding",
+        )
+
+    def test_bulk_ingest_fills_severity_rank(self):
+        """bulk_ingest denormalizes severity_rank like save() does."""
+        self.Finding.objects.bulk_ingest(
+            [self._finding("n+1 query", "critical"), self._finding("dead code", "low")]
+        )
+
+        ranks = dict(self.Finding.objects.values_list("title", "severity_rank"))
+        self.assertEqual(
+            ranks,
+            {
+                "n+1 query": self.Finding.SEVERITY_RANK["critical"],
+                "dead code": self.Finding.SEVERITY_RANK["low"],
+            },
+        )
+
+    def test_bulk_ingest_skips_duplicate_findings(self):
+        """Re-ingesting the same (run, category, title) is a no-op."""
+        self.Finding.objects.bulk_ingest([self._finding("n+1 query")])
+        self.Finding.objects.bulk_ingest(
+            [self._finding("n+1 query"), self._finding("missing index")]
+        )
+
+        self.assertEqual(self.Finding.objects.count(), 2)
+
+    def test_acknowledge_sets_status_fields(self):
+        """acknowledge writes status, user and timestamp in one UPDATE."""
+        self.Finding.objects.bulk_ingest([self._finding("n+1 query")])
+        finding = self.Finding.objects.get(title="n+1 query")
+        user = User.objects.create_user(username="agent_reviewer")
+
+        updated = self.Finding.objects.acknowledge(finding.pk, user)
+
+        self.assertEqual(updated, 1)
+        finding.refresh_from_db()
+        self.assertEqual(finding.status, "acknowledged")
+        self.assertEqual(finding.acknowledged_by, user)
+        self.assertIsNotNone(finding.acknowledged_at)
+
+    def test_acknowledge_missing_finding_updates_nothing(self):
+        """A nonexistent pk reports zero rows updated."""
+        user = User.objects.create_user(username="agent_reviewer")
+
+        self.assertEqual(self.Finding.objects.acknowledge(999999, user), 0)
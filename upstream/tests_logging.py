@@ -405,6 +405,23 @@ class PHIScrubberFilterTests(TestCase):
         self.assertIn('[REDACTED_ADDRESS]', scrubbed)
         self.assertNotIn('123 Main Street', scrubbed)
 
+    def test_scrub_address_every_suffix(self):
+        """Every street-suffix alternative survives the literal prefilter.
+
+        Regression test: the ADDRESS trigger tuple once held only the
+        abbreviations ('rd', 'ln', 'ct'), so spelled-out suffixes like
+        'Road' skipped the regexes entirely and leaked unredacted.
+        """
+        suffixes = [
+            "Street", "St", "Avenue", "Ave", "Road", "Rd", "Boulevard",
+            "Blvd", "Lane", "Ln", "Drive", "Dr", "Court", "Ct",
+        ]
+        for suffix in suffixes:
+            text = f"Patient lives at 123 Elm {suffix}"
+            scrubbed = self.scrubber.scrub_phi(text)
+            self.assertIn('[REDACTED_ADDRESS]', scrubbed, f"leaked: {text}")
+            self.assertNotIn(f"123 Elm {suffix}", scrubbed)
+
     def test_scrub_credit_card(self):
         """Credit card number is scrubbed."""
         text = "Card: 1234-5678-9012-3456"
@@ -556,3 +573,66 @@ class PHIHelperFunctionTests(TestCase):
         """is_phi_present returns False for safe text."""
         text = "Processing upload complete"
         self.assertFalse(is_phi_present(text))
+
+
+# Queued rotating file handler tests
+
+import os
+import tempfile
+import time
+
+from upstream.logging_utils import QueuedTimedRotatingFileHandler
+
+
+class QueuedTimedRotatingFileHandlerTests(TestCase):
+    """Tests for the queue-fronted rotating file handler."""
+
+    def _make_record(self, level, msg):
+        return logging.LogRecord(
+            "upstream.tests.queued_handler", level, __file__, 1, msg, (), None
+        )
+
+    def test_close_flushes_buffered_records(self):
+        """Records below the flush level reach the file on close."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "app.log")
+            handler = QueuedTimedRotatingFileHandler(
+                path, when="midnight", backupCount=1
+            )
+            handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+            # Fewer records than buffer_capacity: nothing is forced out
+            # until close() stops the listener and flushes the buffer
+            handler.handle(self._make_record(logging.INFO, "buffered info"))
+            handler.close()
+
+            with open(path) as fh:
+                content = fh.read()
+        self.assertIn("INFO buffered info", content)
+
+    def test_warning_flushes_buffer_immediately(self):
+        """WARNING and above flush without waiting for close()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "app.log")
+            handler = QueuedTimedRotatingFileHandler(
+                path, when="midnight", backupCount=1
+            )
+            handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+            try:
+                handler.handle(self._make_record(logging.INFO, "buffered info"))
+                handler.handle(self._make_record(logging.WARNING, "flush now"))
+
+                # The listener drains on its own thread; poll briefly
+                content = ""
+                deadline = time.monotonic() + 5
+                while time.monotonic() < deadline:
+                    with open(path) as fh:
+                        content = fh.read()
+                    if "flush now" in content:
+                        break
+                    time.sleep(0.01)
+            finally:
+                handler.close()
+
+        self.assertIn("INFO buffered info", content)
+        self.assertIn("WARNING flush now", content)
@@ -312,3 +312,158 @@ class IntegrationLogIndexTest(TestCase):
             "desc" in columns[1].lower(),
             f"Second column should have DESC modifier, got: {columns[1]}",
         )
+
+
+class DataQualityDailySummaryRecordTests(TestCase):
+    """Test the daily summary rollup maintained on report creation."""
+
+    def setUp(self):
+        from upstream.models import Customer
+
+        self.customer = Customer.objects.create(name="Summary Customer")
+
+    def _create_report(self, filename, total_rows, accepted_rows):
+        from upstream.models import DataQualityReport, Upload
+
+        upload = Upload.all_objects.create(
+            customer=self.customer, filename=filename, status="success"
+        )
+        return DataQualityReport.all_objects.create(
+            upload=upload,
+            customer=self.customer,
+            total_rows=total_rows,
+            accepted_rows=accepted_rows,
+            rejected_rows=total_rows - accepted_rows,
+        )
+
+    def test_reports_accumulate_into_one_day_bucket(self):
+        """Two same-day reports fold into a single summary row."""
+        from upstream.models import DataQualityDailySummary
+
+        self._create_report("first.csv", total_rows=100, accepted_rows=90)
+        self._create_report("second.csv", total_rows=50, accepted_rows=40)
+
+        summaries = DataQualityDailySummary.all_objects.filter(
+            customer=self.customer
+        )
+        self.assertEqual(summaries.count(), 1)
+        summary = summaries.get()
+        self.assertEqual(summary.total_rows, 150)
+        self.assertEqual(summary.accepted_rows, 130)
+
+    def test_record_buckets_by_report_day(self):
+        """record() folds into the bucket for the report's local date."""
+        from datetime import timedelta
+
+        from django.utils import timezone
+
+        from upstream.models import DataQualityDailySummary
+
+        report = self._create_report("late.csv", total_rows=10, accepted_rows=8)
+        # Re-dating the report and recording again writes yesterday's
+        # bucket without touching today's
+        report.created_at = timezone.now() - timedelta(days=1)
+        DataQualityDailySummary.record(report)
+
+        summaries = DataQualityDailySummary.all_objects.filter(
+            customer=self.customer
+        ).order_by("day")
+        self.assertEqual(summaries.count(), 2)
+        yesterday, today = summaries
+        self.assertEqual(yesterday.day, timezone.localdate() - timedelta(days=1))
+        self.assertEqual(yesterday.total_rows, 10)
+        self.assertEqual(today.total_rows, 10)
+
+
+class DriftAggregateRollupTests(TestCase):
+    """Test the DriftAggregateRollup fold/read maintenance API."""
+
+    def setUp(self):
+        from upstream.models import Customer
+
+        self.customer = Customer.objects.create(name="Rollup Customer")
+
+    def test_fold_day_replaces_recomputed_bucket(self):
+        """Re-folding a day overwrites the bucket instead of accumulating."""
+        from datetime import date
+
+        from upstream.models import DriftAggregateRollup
+
+        bucket = date(2026, 8, 1)
+        DriftAggregateRollup.fold_day(
+            self.customer, "DriftWatch", bucket, {"Aetna|OFFICE": [1.0, 2.0, 3.0]}
+        )
+        DriftAggregateRollup.fold_day(
+            self.customer, "DriftWatch", bucket, {"Aetna|OFFICE": [4.0, 6.0]}
+        )
+
+        rows = DriftAggregateRollup.all_objects.filter(
+            customer=self.customer, product="DriftWatch", bucket_date=bucket
+        )
+        self.assertEqual(rows.count(), 1)
+        row = rows.get()
+        self.assertEqual(row.value_sum, 10.0)
+        self.assertEqual(row.value_count, 2)
+        self.assertEqual(row.value_sum_sq, 52.0)
+
+    def test_baseline_stats_mean_and_std_over_window(self):
+        """baseline_stats aggregates day buckets into per-dimension stats."""
+        from datetime import date
+
+        from upstream.models import DriftAggregateRollup
+
+        DriftAggregateRollup.fold_day(
+            self.customer, "DriftWatch", date(2026, 8, 1), {"Aetna|OFFICE": [2.0, 4.0]}
+        )
+        DriftAggregateRollup.fold_day(
+            self.customer, "DriftWatch", date(2026, 8, 2), {"Aetna|OFFICE": [6.0, 8.0]}
+        )
+        # Outside the queried window: must not contribute
+        DriftAggregateRollup.fold_day(
+            self.customer, "DriftWatch", date(2026, 9, 1), {"Aetna|OFFICE": [100.0]}
+        )
+
+        stats = DriftAggregateRollup.baseline_stats(
+            self.customer, "DriftWatch", date(2026, 8, 1), date(2026, 9, 1)
+        )
+
+        self.assertEqual(set(stats), {"Aetna|OFFICE"})
+        self.assertEqual(stats["Aetna|OFFICE"]["count"], 4)
+        # Population stats over [2, 4, 6, 8]: mean 5, variance 5
+        self.assertAlmostEqual(stats["Aetna|OFFICE"]["mean"], 5.0)
+        self.assertAlmostEqual(stats["Aetna|OFFICE"]["std_dev"], 5.0**0.5)
+
+    def test_baseline_stats_scoped_by_customer_and_product(self):
+        """Rollups for other customers/products stay out of the stats."""
+        from datetime import date
+
+        from upstream.models import Customer, DriftAggregateRollup
+
+        other = Customer.objects.create(name="Other Rollup Customer")
+        bucket = date(2026, 8, 1)
+        DriftAggregateRollup.fold_day(
+            self.customer, "DriftWatch", bucket, {"Aetna|OFFICE": [3.0]}
+        )
+        DriftAggregateRollup.fold_day(
+            other, "DriftWatch", bucket, {"Aetna|OFFICE": [50.0]}
+        )
+        DriftAggregateRollup.fold_day(
+            self.customer, "DelayGuard", bucket, {"Aetna|OFFICE": [70.0]}
+        )
+
+        stats = DriftAggregateRollup.baseline_stats(
+            self.customer, "DriftWatch", bucket, date(2026, 8, 2)
+        )
+        self.assertEqual(stats["Aetna|OFFICE"]["count"], 1)
+        self.assertAlmostEqual(stats["Aetna|OFFICE"]["mean"], 3.0)
+
+    def test_baseline_stats_empty_window(self):
+        """No rollup coverage yields an empty dict (caller falls back)."""
+        from datetime import date
+
+        from upstream.models import DriftAggregateRollup
+
+        stats = DriftAggregateRollup.baseline_stats(
+            self.customer, "DriftWatch", date(2026, 8, 1), date(2026, 9, 1)
+        )
+        self.assertEqual(stats, {})
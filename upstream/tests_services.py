@@ -12,6 +12,7 @@ from datetime import date, datetime, timedelta
 from decimal import Decimal
 from unittest.mock import Mock
 
+from upstream.services.base_drift_detection import BaseDriftDetectionService
 from upstream.services.data_quality import DataQualityService
 from upstream.services.report_generation import ReportGenerationService
 from upstream.services.alert_processing import AlertProcessingService
@@ -99,6 +100,20 @@ class TestDataQualityService:
         assert len(errors) > 0
         assert any("privacy" in err.lower() or "phi" in err.lower() for err in errors)
 
+    def test_validate_not_phi_any_whitespace_separator(self):
+        """Tab/newline-separated names are still flagged as PHI.
+
+        Regression test: a fast path once checked for a literal space,
+        letting "John\\tSmith" through unflagged.
+        """
+        for value in ["John\tSmith", "John\nSmith", "  Mary Jane Watson "]:
+            with pytest.raises(ValueError):
+                DataQualityService._validate_not_phi(value, "payer")
+
+        # Payer names stay accepted regardless of whitespace
+        for value in ["Aetna", "Blue Cross\tBlue Shield", "Medicare\n"]:
+            DataQualityService._validate_not_phi(value, "payer")
+
     def test_validate_claim_data_invalid_outcome(self):
         """Test invalid outcome value validation."""
         claim_row = {
@@ -203,6 +218,177 @@ class TestDataQualityService:
         assert len(zero_patterns) > 0
 
 
+class TestValidateClaimsBatch:
+    """Parity tests for the columnar batch validation path."""
+
+    # One row per validation branch: clean, invalid outcome, zero
+    # amount (allowed), PHI-shaped payer, missing required field,
+    # negative amount, unparseable amount
+    FIXTURE_ROWS = [
+        {
+            "payer": "Aetna",
+            "cpt": "99213",
+            "submitted_date": "2024-01-01",
+            "decided_date": "2024-01-05",
+            "outcome": "PAID",
+            "allowed_amount": "150.00",
+        },
+        {
+            "payer": "Blue Cross",
+            "cpt": "99214",
+            "submitted_date": "2024-01-02",
+            "decided_date": "2024-01-06",
+            "outcome": "MAYBE",
+            "allowed_amount": "10.00",
+        },
+        {
+            "payer": "Medicare",
+            "cpt": "99215",
+            "submitted_date": "2024-01-03",
+            "decided_date": "2024-01-03",
+            "outcome": "PAID",
+            "allowed_amount": "0.00",
+        },
+        {
+            "payer": "John Smith",
+            "cpt": "99213",
+            "submitted_date": "2024-01-04",
+            "decided_date": "2024-01-08",
+            "outcome": "PAID",
+            "allowed_amount": "25.00",
+        },
+        {
+            "payer": "Cigna",
+            "cpt": "99213",
+            "submitted_date": "",
+            "decided_date": "2024-01-09",
+            "outcome": "PAID",
+            "allowed_amount": "50.00",
+        },
+        {
+            "payer": "United Healthcare",
+            "cpt": "99213",
+            "submitted_date": "2024-01-05",
+            "decided_date": "2024-01-10",
+            "outcome": "DENIED",
+            "allowed_amount": "-5.00",
+        },
+        {
+            "payer": "Humana",
+            "cpt": "99213",
+            "submitted_date": "2024-01-06",
+            "decided_date": "2024-01-11",
+            "outcome": "OTHER",
+            "allowed_amount": "abc",
+        },
+    ]
+
+    def test_batch_matches_scalar_row_by_row(self):
+        """Both paths produce identical error lists over the fixture."""
+        pd = pytest.importorskip("pandas")
+
+        batch = DataQualityService.validate_claims_batch(
+            pd.DataFrame(self.FIXTURE_ROWS), start_row=2
+        )
+        scalar = [
+            DataQualityService.validate_claim_data(row, 2 + i)
+            for i, row in enumerate(self.FIXTURE_ROWS)
+        ]
+
+        assert batch == scalar
+        # Sanity: the fixture exercises both valid and invalid rows
+        assert batch[0] == []
+        assert batch[2] == []
+        assert any("outcome" in err.lower() for err in batch[1])
+        assert any("privacy" in err.lower() for err in batch[3])
+        assert any("missing required field" in err.lower() for err in batch[4])
+        assert any("negative" in err for err in batch[5])
+        assert any("Invalid allowed_amount" in err for err in batch[6])
+
+    def test_missing_required_column_matches_scalar(self):
+        """A column absent from the frame reports like absent dict keys."""
+        pd = pytest.importorskip("pandas")
+
+        rows = [
+            {
+                "payer": "Aetna",
+                "cpt": "99213",
+                "submitted_date": "2024-01-01",
+                "decided_date": "2024-01-05",
+            }
+            for _ in range(2)
+        ]
+
+        batch = DataQualityService.validate_claims_batch(pd.DataFrame(rows))
+        scalar = [
+            DataQualityService.validate_claim_data(row, 2 + i)
+            for i, row in enumerate(rows)
+        ]
+
+        assert batch == scalar
+        for row_errors in batch:
+            assert any("Missing required field: outcome" in e for e in row_errors)
+
+    def test_empty_frame(self):
+        """An empty DataFrame validates to an empty error list."""
+        pd = pytest.importorskip("pandas")
+
+        assert DataQualityService.validate_claims_batch(pd.DataFrame()) == []
+
+
+# ============================================================================
+# BaseDriftDetectionService Tests
+# ============================================================================
+
+
+class TestBaseDriftDetectionConfidence:
+    """Tests for the confidence scoring helpers."""
+
+    def test_compute_confidence_scores_matches_scalar_elementwise(self):
+        """Batch scores equal the scalar helper, element by element.
+
+        Covers the edges of both factors: sample sizes from zero through
+        the saturation point, and z-scores at zero, below/at/above the
+        1.96 significance cutoff, in both sign directions. With numpy
+        installed this exercises the vectorized branch against the
+        scalar path; without it the fallback loop is trivially equal.
+        """
+        sample_sizes = [0, 1, 5, 19, 20, 40, 100, 400]
+        z_scores = [0.0, 0.5, -0.5, 1.96, -1.96, 2.5, -3.0, 10.0]
+
+        batch = BaseDriftDetectionService.compute_confidence_scores(
+            sample_sizes, z_scores
+        )
+        scalar = [
+            BaseDriftDetectionService.compute_confidence_score(n, z)
+            for n, z in zip(sample_sizes, z_scores)
+        ]
+
+        assert batch == scalar
+        assert all(isinstance(score, Decimal) for score in batch)
+
+    def test_compute_confidence_scores_respects_min_sample_size(self):
+        """Non-default min_sample_size flows through both paths alike."""
+        sample_sizes = [5, 10, 20]
+        z_scores = [1.0, 2.0, 0.5]
+
+        batch = BaseDriftDetectionService.compute_confidence_scores(
+            sample_sizes, z_scores, min_sample_size=5
+        )
+        scalar = [
+            BaseDriftDetectionService.compute_confidence_score(
+                n, z, min_sample_size=5
+            )
+            for n, z in zip(sample_sizes, z_scores)
+        ]
+
+        assert batch == scalar
+
+    def test_compute_confidence_scores_empty_input(self):
+        """No candidates yields no scores."""
+        assert BaseDriftDetectionService.compute_confidence_scores([], []) == []
+
+
 # ============================================================================
 # ReportGenerationService Tests (10 tests)
 # ============================================================================
@@ -1,3 +1,4 @@
+import functools
 import re
 from django.http import HttpRequest
 
@@ -54,24 +55,33 @@ DOB_PATTERN = re.compile(r"\b\d{1,2}/\d{1,2}/\d{4}\b")
 PHONE_PATTERN = re.compile(r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b")
 EMAIL_PATTERN = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
 MRN_PATTERN = re.compile(r"\bMRN[:\s]*\d+\b", re.IGNORECASE)
+WORD_CLEAN_PATTERN = re.compile(r"[^\w\s]")
 
 
 def detect_phi(text):
     """
     Detect potential PHI (Protected Health Information) in text.
 
+    Pure text classification, so results are memoized; validators often
+    re-check the same payer/field strings many times per upload.
+
     Returns:
         (has_phi, message): Tuple of boolean and error message
     """
     if not text or not isinstance(text, str):
         return False, ""
+    return _detect_phi_cached(text)
+
 
+@functools.lru_cache(maxsize=2048)
+def _detect_phi_cached(text):
+    """Uncached PHI scan backing detect_phi (str input only)."""
     text_lower = text.lower()
     words = text_lower.split()
 
     # Check for common first names
     for word in words:
-        clean_word = re.sub(r"[^\w\s]", "", word)
+        clean_word = WORD_CLEAN_PATTERN.sub("", word)
         if clean_word in COMMON_FIRST_NAMES:
             return True, f"Field may contain PHI: '{word}' appears to be a name"
 